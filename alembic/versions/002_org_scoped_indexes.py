@@ -0,0 +1,33 @@
+"""Add org-scoped indexes on notes and todos
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notes_org_created_at_id', 'notes', ['organization_id', 'created_at', 'id'])
+    op.create_index('ix_notes_org_created_by_created_at', 'notes', ['organization_id', 'created_by', 'created_at'])
+    
+    op.create_index('ix_todos_org_created_at_id', 'todos', ['organization_id', 'created_at', 'id'])
+    op.create_index('ix_todos_org_created_by_created_at', 'todos', ['organization_id', 'created_by', 'created_at'])
+    op.create_index('ix_todos_org_completed', 'todos', ['organization_id', 'completed'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_todos_org_completed', table_name='todos')
+    op.drop_index('ix_todos_org_created_by_created_at', table_name='todos')
+    op.drop_index('ix_todos_org_created_at_id', table_name='todos')
+    
+    op.drop_index('ix_notes_org_created_by_created_at', table_name='notes')
+    op.drop_index('ix_notes_org_created_at_id', table_name='notes')
@@ -0,0 +1,51 @@
+"""Add organization search name and trigram index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-03-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('organizations', sa.Column('search_name', sa.String(length=100), nullable=True))
+    op.execute("UPDATE organizations SET search_name = LOWER(name)")
+    with op.batch_alter_table('organizations') as batch_op:
+        batch_op.alter_column('search_name', existing_type=sa.String(length=100), nullable=False)
+    op.create_index(op.f('ix_organizations_search_name'), 'organizations', ['search_name'], unique=False)
+    
+    trigrams = op.create_table('organization_trigrams',
+        sa.Column('trigram', sa.String(length=3), nullable=False),
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('trigram', 'organization_id')
+    )
+    op.create_index('ix_organization_trigrams_organization_id', 'organization_trigrams', ['organization_id'])
+    
+    connection = op.get_bind()
+    rows = []
+    for organization_id, search_name in connection.execute(sa.text("SELECT id, search_name FROM organizations")).all():
+        rows.extend(
+            {"trigram": trigram, "organization_id": organization_id}
+            for trigram in {search_name[index:index + 3] for index in range(len(search_name) - 2)}
+        )
+        if len(rows) >= 10000:
+            op.bulk_insert(trigrams, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(trigrams, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_trigrams_organization_id', table_name='organization_trigrams')
+    op.drop_table('organization_trigrams')
+    op.drop_index(op.f('ix_organizations_search_name'), table_name='organizations')
+    op.drop_column('organizations', 'search_name')
@@ -0,0 +1,25 @@
+"""Add version columns to notes and todos for ETags
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('notes', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('todos', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('todos', 'version')
+    op.drop_column('notes', 'version')
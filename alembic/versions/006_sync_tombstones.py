@@ -0,0 +1,39 @@
+"""Add tombstones and updated_at indexes for incremental sync
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-04-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notes_org_updated_at_id', 'notes', ['organization_id', 'updated_at', 'id'])
+    op.create_index('ix_todos_org_updated_at_id', 'todos', ['organization_id', 'updated_at', 'id'])
+    
+    op.create_table('tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.Column('resource_type', sa.String(length=20), nullable=False),
+        sa.Column('resource_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_org_deleted_at_id', 'tombstones', ['organization_id', 'deleted_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tombstones_org_deleted_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
+    
+    op.drop_index('ix_todos_org_updated_at_id', table_name='todos')
+    op.drop_index('ix_notes_org_updated_at_id', table_name='notes')
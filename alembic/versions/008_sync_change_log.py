@@ -0,0 +1,50 @@
+"""Page /sync by a commit-ordered change log instead of write timestamps
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-05-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    
+    # Existing rows get change 0, so the first sync of every client still returns them.
+    for table in ('notes', 'todos', 'tombstones'):
+        op.add_column(table, sa.Column('change_id', sa.Integer(), server_default='0', nullable=False))
+    
+    op.drop_index('ix_notes_org_updated_at_id', table_name='notes')
+    op.drop_index('ix_todos_org_updated_at_id', table_name='todos')
+    op.drop_index('ix_tombstones_org_deleted_at_id', table_name='tombstones')
+    op.create_index('ix_notes_org_change_id_id', 'notes', ['organization_id', 'change_id', 'id'])
+    op.create_index('ix_todos_org_change_id_id', 'todos', ['organization_id', 'change_id', 'id'])
+    op.create_index('ix_tombstones_org_change_id_id', 'tombstones', ['organization_id', 'change_id', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tombstones_org_change_id_id', table_name='tombstones')
+    op.drop_index('ix_todos_org_change_id_id', table_name='todos')
+    op.drop_index('ix_notes_org_change_id_id', table_name='notes')
+    op.create_index('ix_tombstones_org_deleted_at_id', 'tombstones', ['organization_id', 'deleted_at', 'id'])
+    op.create_index('ix_todos_org_updated_at_id', 'todos', ['organization_id', 'updated_at', 'id'])
+    op.create_index('ix_notes_org_updated_at_id', 'notes', ['organization_id', 'updated_at', 'id'])
+    
+    for table in ('tombstones', 'todos', 'notes'):
+        op.drop_column(table, 'change_id')
+    
+    op.drop_table('changes')
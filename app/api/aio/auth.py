@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.core.security import get_password_hash_async, verify_password_async, create_access_token, remember_token_version
+from app.models.user import User, UserRole
+from app.models.organization import Organization
+from app.api.organizations import invalidate_public_organizations
+from app.schemas.user import UserCreate, UserLogin, Token, UserResponse
+from app.deps import get_current_user_async
+from datetime import timedelta
+from app.core.config import settings
+
+router = APIRouter(prefix="/auth", tags=["authentication"])
+
+
+async def _get_user_by_username(db: AsyncSession, username: str):
+    user = await db.scalar(select(User).where(User.username == username))
+    # Hand the connection back to the pool before waiting on a bcrypt slot.
+    await db.close()
+    return user
+
+
+@router.post("/signup", response_model=UserResponse)
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    existing_user = await _get_user_by_username(db, user_data.username)
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
+    
+    hashed_password = await get_password_hash_async(user_data.password)
+    
+    organization = await db.scalar(select(Organization).where(Organization.name == user_data.organization_name))
+    
+    if organization:
+        role = UserRole.MEMBER
+        organization_id = organization.id
+        new_organization = False
+    else:
+        organization = Organization(name=user_data.organization_name)
+        db.add(organization)
+        await db.flush()
+        role = UserRole.ADMIN
+        organization_id = organization.id
+        new_organization = True
+    
+    user = User(
+        username=user_data.username,
+        password_hash=hashed_password,
+        role=role,
+        organization_id=organization_id
+    )
+    
+    db.add(user)
+    await db.commit()
+    
+    if new_organization:
+        invalidate_public_organizations()
+    
+    return user
+
+
+@router.post("/login", response_model=Token)
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = await _get_user_by_username(db, user_credentials.username)
+    if not user or not await verify_password_async(user_credentials.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={
+            "sub": user.username,
+            "user_id": user.id,
+            "organization_id": user.organization_id,
+            "role": user.role.value,
+            "token_version": user.token_version
+        },
+        expires_delta=access_token_expires
+    )
+    remember_token_version(user.id, user.token_version)
+    
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.get("/me")
+async def get_current_user_info(current_user: User = Depends(get_current_user_async)):
+    return {
+        "id": current_user.id,
+        "username": current_user.username,
+        "role": current_user.role.value,
+        "organization_id": current_user.organization_id,
+        "created_at": current_user.created_at.isoformat()
+    }
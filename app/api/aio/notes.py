@@ -0,0 +1,184 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from app.database import get_async_db
+from app.api.notes import NOTE_FIELDS, _note_rows, _note_to_dict, _publish_note
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.etag import etag_matches, expected_version, make_etag, version_lookup, versioned_delete_async, versioned_update_async
+from app.core.pagination import seek, page
+from app.core.list_cache import cached_list_response_async, invalidate_lists
+from app.core.fields import parse_fields
+from app.core.serialization import FastJSONResponse, list_response
+from app.deps import get_current_user_async, get_current_principal_async, require_admin_role_async
+from app.models.change import record_change_async
+from app.models.note import Note
+from app.models.tombstone import tombstones_for
+from app.models.user import User
+from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse, NoteWithUser, NotePage
+from app.schemas.user import Principal
+from typing import List, Optional, Union
+
+router = APIRouter(prefix="/notes", tags=["notes"])
+
+
+async def _note_list_response(db: AsyncSession, stmt, limit: Optional[int], cursor: Optional[str], fields: Optional[List[str]] = None):
+    if limit is None and cursor is None:
+        result = await db.execute(stmt)
+        return list_response(fields or result.keys(), result, resource=Note.__tablename__)
+    
+    limit = limit or settings.default_page_size
+    result = await db.execute(seek(stmt, Note, limit, cursor))
+    notes, next_cursor = page(result.all(), limit)
+    return list_response(fields or result.keys(), notes, paginated=True, next_cursor=next_cursor, resource=Note.__tablename__)
+
+
+@router.get("/", response_model=Union[List[NoteWithUser], NotePage])
+async def get_notes(
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, NOTE_FIELDS)
+    stmt = _note_rows(Note.organization_id == current_user.organization_id, fields=fields)
+    
+    return await cached_list_response_async(
+        db, Note, current_user.organization_id, ("all", fields, limit, cursor),
+        lambda: _note_list_response(db, stmt, limit, cursor, fields)
+    )
+
+
+@router.get("/my-notes", response_model=Union[List[NoteWithUser], NotePage])
+async def get_my_notes(
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, NOTE_FIELDS)
+    stmt = _note_rows(
+        Note.organization_id == current_user.organization_id,
+        Note.created_by == current_user.id,
+        fields=fields
+    )
+    
+    return await cached_list_response_async(
+        db, Note, current_user.organization_id, ("user", current_user.id, fields, limit, cursor),
+        lambda: _note_list_response(db, stmt, limit, cursor, fields)
+    )
+
+
+@router.post("/", response_model=NoteResponse)
+async def create_note(
+    note_data: NoteCreate,
+    response: Response,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    note = Note(
+        title=note_data.title,
+        content=note_data.content,
+        organization_id=current_user.organization_id,
+        created_by=current_user.id,
+        change_id=change_id
+    )
+    
+    db.add(note)
+    await db.commit()
+    
+    invalidate_lists(Note, note.organization_id)
+    _publish_note("created", note)
+    response.headers["ETag"] = make_etag(note.version)
+    return note
+
+
+@router.get("/{note_id}", response_model=NoteWithUser)
+async def get_note(
+    note_id: int,
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, NOTE_FIELDS)
+    if if_none_match is not None:
+        version = await db.scalar(version_lookup(Note, note_id, current_user.organization_id))
+        if version is not None and etag_matches(if_none_match, make_etag(version)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(version)})
+    
+    if fields is not None:
+        row = (await db.execute(_note_rows(
+            Note.id == note_id,
+            Note.organization_id == current_user.organization_id,
+            fields=fields
+        ))).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        return FastJSONResponse(dict(zip(fields, row)), headers={"ETag": make_etag(row.version)})
+    
+    note = await db.scalar(
+        select(Note).options(
+            joinedload(Note.created_by_user, innerjoin=True)
+        ).where(
+            Note.id == note_id,
+            Note.organization_id == current_user.organization_id
+        )
+    )
+    
+    if not note:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Note not found"
+        )
+    
+    response.headers["ETag"] = make_etag(note.version)
+    return _note_to_dict(note)
+
+
+@router.put("/{note_id}", response_model=NoteResponse)
+async def update_note(
+    note_id: int,
+    note_data: NoteUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    note = await versioned_update_async(
+        db, Note, note_id, current_user.organization_id,
+        expected_version(if_match), {**note_data.model_dump(exclude_none=True), "change_id": change_id}, "Note not found"
+    )
+    await db.commit()
+    
+    invalidate_lists(Note, note.organization_id)
+    _publish_note("updated", note)
+    response.headers["ETag"] = make_etag(note.version)
+    return note
+
+
+@router.delete("/{note_id}")
+async def delete_note(
+    note_id: int,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    await versioned_delete_async(db, Note, note_id, current_user.organization_id, expected_version(if_match), "Note not found")
+    await db.execute(tombstones_for(Note, current_user.organization_id, [note_id], change_id))
+    await db.commit()
+    
+    invalidate_lists(Note, current_user.organization_id)
+    publish_change(Note, current_user.organization_id, "deleted", {"id": note_id})
+    
+    return {"message": "Note deleted successfully"}
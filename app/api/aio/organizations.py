@@ -0,0 +1,187 @@
+import time
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.api.organizations import (
+    _conditional_response,
+    _infix_search_query,
+    _normalize_search_term,
+    _prefix_search_query,
+    _public_cache,
+    _public_listing,
+    _rank_infix_matches,
+    _rarest_trigram,
+    _search_cache,
+    _trigram_counts_query,
+    _organization_summaries,
+)
+from app.core.config import settings
+from app.core.pagination import page, seek
+from app.core.security import revoke_user_tokens
+from app.deps import get_current_principal_async, require_admin_role_async
+from app.models.organization import Organization, name_trigrams
+from app.models.user import User, UserRole
+from app.schemas.organization import OrganizationResponse, OrganizationSummary, OrganizationPage
+from app.schemas.user import Principal
+from typing import List, Optional, Union
+
+router = APIRouter(prefix="/organizations", tags=["organizations"])
+
+
+def _check_same_organization(current_user: User, organization_id: int) -> None:
+    if current_user.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. You can only access your organization's data."
+        )
+
+
+async def _get_org_user(db: AsyncSession, organization_id: int, user_id: int) -> User:
+    user = await db.scalar(
+        select(User).where(
+            User.id == user_id,
+            User.organization_id == organization_id
+        )
+    )
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found in this organization"
+        )
+    
+    return user
+
+
+@router.get("/me", response_model=OrganizationResponse)
+async def get_my_organization(current_user: Principal = Depends(get_current_principal_async), db: AsyncSession = Depends(get_async_db)):
+    organization = await db.get(Organization, current_user.organization_id)
+    if not organization:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
+        )
+    return organization
+
+
+@router.get("/public", response_model=Union[List[OrganizationSummary], OrganizationPage])
+async def get_public_organizations(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    cache_key = (limit, cursor)
+    listing = _public_cache.get(cache_key)
+    if listing is None:
+        query = select(Organization)
+        if limit is None and cursor is None:
+            listing = _public_listing((await db.scalars(query)).all())
+        else:
+            limit = limit or settings.default_page_size
+            organizations, next_cursor = page((await db.scalars(seek(query, Organization, limit, cursor))).all(), limit)
+            listing = _public_listing(organizations, paginated=True, next_cursor=next_cursor)
+        _public_cache.set(cache_key, listing, expires_at=time.time() + settings.public_organizations_cache_ttl)
+    
+    return _conditional_response(request, listing)
+
+
+@router.get("/search", response_model=List[dict])
+async def search_organizations(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(settings.organization_search_limit, ge=1, le=settings.organization_search_max_limit),
+    db: AsyncSession = Depends(get_async_db)
+):
+    response.headers["Cache-Control"] = f"public, max-age={settings.organization_search_cache_ttl}"
+    term = _normalize_search_term(q)
+    if not term:
+        return []
+    
+    cache_key = (term, limit)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    organizations = list((await db.scalars(_prefix_search_query(term, limit))).all())
+    if len(organizations) < limit and len(term) >= 3:
+        exclude = [org.id for org in organizations]
+        remaining = limit - len(organizations)
+        trigrams = sorted(name_trigrams(term))
+        driver_trigram = _rarest_trigram(trigrams, (await db.execute(_trigram_counts_query(trigrams))).one())
+        if driver_trigram is not None:
+            infix = (await db.scalars(_infix_search_query(term, driver_trigram, remaining, exclude))).all()
+            organizations += _rank_infix_matches(infix, remaining)
+    
+    result = _organization_summaries(organizations)
+    _search_cache.set(cache_key, result, expires_at=time.time() + settings.organization_search_cache_ttl)
+    return result
+
+
+@router.get("/{organization_id}/users", response_model=List[dict])
+async def get_organization_users(
+    organization_id: int,
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    _check_same_organization(current_user, organization_id)
+    
+    users = (await db.scalars(select(User).where(User.organization_id == organization_id))).all()
+    return [
+        {
+            "id": user.id,
+            "username": user.username,
+            "role": user.role.value,
+            "created_at": user.created_at
+        }
+        for user in users
+    ]
+
+
+@router.put("/{organization_id}/users/{user_id}")
+async def update_user_role(
+    organization_id: int,
+    user_id: int,
+    role: UserRole,
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    _check_same_organization(current_user, organization_id)
+    user = await _get_org_user(db, organization_id, user_id)
+    
+    if user.id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot change your own role"
+        )
+    
+    user.role = role
+    user.token_version = User.token_version + 1
+    await db.commit()
+    revoke_user_tokens(user.id)
+    
+    return {"message": f"User {user.username} role updated to {role.value}"}
+
+
+@router.delete("/{organization_id}/users/{user_id}")
+async def remove_user_from_organization(
+    organization_id: int,
+    user_id: int,
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    _check_same_organization(current_user, organization_id)
+    user = await _get_org_user(db, organization_id, user_id)
+    
+    if user.id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot remove yourself from the organization"
+        )
+    
+    await db.delete(user)
+    await db.commit()
+    revoke_user_tokens(user.id)
+    
+    return {"message": f"User {user.username} removed from organization"}
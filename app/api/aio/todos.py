@@ -0,0 +1,184 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from app.database import get_async_db
+from app.api.todos import TODO_FIELDS, _todo_rows, _todo_to_dict, _publish_todo
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.etag import etag_matches, expected_version, make_etag, version_lookup, versioned_delete_async, versioned_update_async
+from app.core.pagination import seek, page
+from app.core.list_cache import cached_list_response_async, invalidate_lists
+from app.core.fields import parse_fields
+from app.core.serialization import FastJSONResponse, list_response
+from app.deps import get_current_user_async, get_current_principal_async, require_admin_role_async
+from app.models.change import record_change_async
+from app.models.todo import Todo
+from app.models.tombstone import tombstones_for
+from app.models.user import User
+from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse, TodoWithUser, TodoPage
+from app.schemas.user import Principal
+from typing import List, Optional, Union
+
+router = APIRouter(prefix="/todos", tags=["todos"])
+
+
+async def _todo_list_response(db: AsyncSession, stmt, limit: Optional[int], cursor: Optional[str], fields: Optional[List[str]] = None):
+    if limit is None and cursor is None:
+        result = await db.execute(stmt)
+        return list_response(fields or result.keys(), result, resource=Todo.__tablename__)
+    
+    limit = limit or settings.default_page_size
+    result = await db.execute(seek(stmt, Todo, limit, cursor))
+    todos, next_cursor = page(result.all(), limit)
+    return list_response(fields or result.keys(), todos, paginated=True, next_cursor=next_cursor, resource=Todo.__tablename__)
+
+
+@router.get("/", response_model=Union[List[TodoWithUser], TodoPage])
+async def get_todos(
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, TODO_FIELDS)
+    stmt = _todo_rows(Todo.organization_id == current_user.organization_id, fields=fields)
+    
+    return await cached_list_response_async(
+        db, Todo, current_user.organization_id, ("all", fields, limit, cursor),
+        lambda: _todo_list_response(db, stmt, limit, cursor, fields)
+    )
+
+
+@router.get("/my-todos", response_model=Union[List[TodoWithUser], TodoPage])
+async def get_my_todos(
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, TODO_FIELDS)
+    stmt = _todo_rows(
+        Todo.organization_id == current_user.organization_id,
+        Todo.created_by == current_user.id,
+        fields=fields
+    )
+    
+    return await cached_list_response_async(
+        db, Todo, current_user.organization_id, ("user", current_user.id, fields, limit, cursor),
+        lambda: _todo_list_response(db, stmt, limit, cursor, fields)
+    )
+
+
+@router.post("/", response_model=TodoResponse)
+async def create_todo(
+    todo_data: TodoCreate,
+    response: Response,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    todo = Todo(
+        title=todo_data.title,
+        completed=todo_data.completed,
+        organization_id=current_user.organization_id,
+        created_by=current_user.id,
+        change_id=change_id
+    )
+    
+    db.add(todo)
+    await db.commit()
+    
+    invalidate_lists(Todo, todo.organization_id)
+    _publish_todo("created", todo)
+    response.headers["ETag"] = make_etag(todo.version)
+    return todo
+
+
+@router.get("/{todo_id}", response_model=TodoWithUser)
+async def get_todo(
+    todo_id: int,
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    fields = parse_fields(fields, TODO_FIELDS)
+    if if_none_match is not None:
+        version = await db.scalar(version_lookup(Todo, todo_id, current_user.organization_id))
+        if version is not None and etag_matches(if_none_match, make_etag(version)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(version)})
+    
+    if fields is not None:
+        row = (await db.execute(_todo_rows(
+            Todo.id == todo_id,
+            Todo.organization_id == current_user.organization_id,
+            fields=fields
+        ))).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Todo not found"
+            )
+        return FastJSONResponse(dict(zip(fields, row)), headers={"ETag": make_etag(row.version)})
+    
+    todo = await db.scalar(
+        select(Todo).options(
+            joinedload(Todo.created_by_user, innerjoin=True)
+        ).where(
+            Todo.id == todo_id,
+            Todo.organization_id == current_user.organization_id
+        )
+    )
+    
+    if not todo:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo not found"
+        )
+    
+    response.headers["ETag"] = make_etag(todo.version)
+    return _todo_to_dict(todo)
+
+
+@router.put("/{todo_id}", response_model=TodoResponse)
+async def update_todo(
+    todo_id: int,
+    todo_data: TodoUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    todo = await versioned_update_async(
+        db, Todo, todo_id, current_user.organization_id,
+        expected_version(if_match), {**todo_data.model_dump(exclude_none=True), "change_id": change_id}, "Todo not found"
+    )
+    await db.commit()
+    
+    invalidate_lists(Todo, todo.organization_id)
+    _publish_todo("updated", todo)
+    response.headers["ETag"] = make_etag(todo.version)
+    return todo
+
+
+@router.delete("/{todo_id}")
+async def delete_todo(
+    todo_id: int,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(require_admin_role_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    change_id = await record_change_async(db, current_user.organization_id)
+    await versioned_delete_async(db, Todo, todo_id, current_user.organization_id, expected_version(if_match), "Todo not found")
+    await db.execute(tombstones_for(Todo, current_user.organization_id, [todo_id], change_id))
+    await db.commit()
+    
+    invalidate_lists(Todo, current_user.organization_id)
+    publish_change(Todo, current_user.organization_id, "deleted", {"id": todo_id})
+    
+    return {"message": "Todo deleted successfully"}
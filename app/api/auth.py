@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash_async, verify_password_async, create_access_token, remember_token_version
 from app.models.user import User, UserRole
 from app.models.organization import Organization
+from app.api.organizations import invalidate_public_organizations
 from app.schemas.user import UserCreate, UserLogin, Token, UserResponse
 from app.deps import get_current_user
 from datetime import timedelta
@@ -12,28 +14,28 @@ from app.core.config import settings
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
-@router.post("/signup", response_model=UserResponse)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-    
+def _get_user_by_username(db: Session, username: str):
+    user = db.query(User).filter(User.username == username).first()
+    # Hand the connection back to the pool before waiting on a bcrypt slot.
+    db.close()
+    return user
+
+
+def _create_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
     organization = db.query(Organization).filter(Organization.name == user_data.organization_name).first()
     
     if organization:
         role = UserRole.MEMBER
         organization_id = organization.id
+        new_organization = False
     else:
         organization = Organization(name=user_data.organization_name)
         db.add(organization)
         db.flush()
         role = UserRole.ADMIN
         organization_id = organization.id
+        new_organization = True
     
-    hashed_password = get_password_hash(user_data.password)
     user = User(
         username=user_data.username,
         password_hash=hashed_password,
@@ -43,15 +45,31 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     
     db.add(user)
     db.commit()
-    db.refresh(user)
+    
+    if new_organization:
+        invalidate_public_organizations()
     
     return user
 
 
+@router.post("/signup", response_model=UserResponse)
+async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+    existing_user = await run_in_threadpool(_get_user_by_username, db, user_data.username)
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
+    
+    hashed_password = await get_password_hash_async(user_data.password)
+    
+    return await run_in_threadpool(_create_user, db, user_data, hashed_password)
+
+
 @router.post("/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == user_credentials.username).first()
-    if not user or not verify_password(user_credentials.password, user.password_hash):
+async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(_get_user_by_username, db, user_credentials.username)
+    if not user or not await verify_password_async(user_credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -64,10 +82,12 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             "sub": user.username,
             "user_id": user.id,
             "organization_id": user.organization_id,
-            "role": user.role.value
+            "role": user.role.value,
+            "token_version": user.token_version
         },
         expires_delta=access_token_expires
     )
+    remember_token_version(user.id, user.token_version)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
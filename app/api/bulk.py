@@ -0,0 +1,208 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.list_cache import invalidate_lists
+from app.database import get_db
+from app.deps import get_current_user, require_admin_role
+from app.models.change import record_change
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.tombstone import tombstones_for
+from app.models.user import User
+from app.schemas.bulk import BulkDelete, BulkItemResult
+from app.schemas.note import NoteCreate, NoteBulkUpdate, NoteResponse
+from app.schemas.todo import TodoCreate, TodoBulkUpdate, TodoResponse
+from typing import List
+
+router = APIRouter(tags=["bulk"])
+
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > settings.bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many items. At most {settings.bulk_max_items} per request."
+        )
+
+
+def _owned_ids(db: Session, model, ids: List[int], organization_id: int) -> set:
+    return set(db.scalars(
+        select(model.id).where(
+            model.id.in_(set(ids)),
+            model.organization_id == organization_id
+        )
+    ))
+
+
+def _insert_consecutive(db: Session, model, rows: list, current_user: User) -> list:
+    # A multi-row INSERT ... VALUES is a "simple insert" to InnoDB: its ids are
+    # consecutive in every autoinc lock mode and LAST_INSERT_ID() is the first one.
+    first_id = db.execute(insert(model).values(rows)).lastrowid
+    objects = db.scalars(
+        select(model)
+        .where(
+            model.id.between(first_id, first_id + len(rows) - 1),
+            model.organization_id == current_user.organization_id,
+            model.created_by == current_user.id
+        )
+        .order_by(model.id)
+    ).all()
+    if len(objects) != len(rows):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Bulk insert ids were not consecutive"
+        )
+    return objects
+
+
+def _bulk_create(db: Session, model, response_schema, items: list, current_user: User) -> list:
+    _check_batch_size(items)
+    
+    if not items:
+        return []
+    
+    change_id = record_change(db, current_user.organization_id)
+    rows = [
+        {
+            **item.model_dump(),
+            "organization_id": current_user.organization_id,
+            "created_by": current_user.id,
+            "change_id": change_id
+        }
+        for item in items
+    ]
+    dialect = db.get_bind().dialect
+    if dialect.name == "mysql":
+        objects = _insert_consecutive(db, model, rows, current_user)
+    elif dialect.name == "sqlite":
+        # SQLite has no sentinel to match RETURNING rows to their parameters, so
+        # asking for parameter order costs a statement per row; its single writer
+        # hands out the rowids of one INSERT in VALUES order instead.
+        objects = sorted(db.scalars(insert(model).returning(model), rows).all(), key=lambda obj: obj.id)
+    elif dialect.insert_executemany_returning:
+        objects = db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+    else:
+        objects = [model(**row) for row in rows]
+        db.add_all(objects)
+        db.flush()
+    result = [response_schema.model_validate(obj) for obj in objects]
+    db.commit()
+    
+    invalidate_lists(model, current_user.organization_id)
+    for item in result:
+        publish_change(model, current_user.organization_id, "created", item.model_dump())
+    
+    return result
+
+
+def _bulk_update(db: Session, model, items: list, current_user: User) -> List[BulkItemResult]:
+    _check_batch_size(items)
+    
+    owned = _owned_ids(db, model, [item.id for item in items], current_user.organization_id)
+    now = datetime.utcnow()
+    
+    rows = [
+        {"id": item.id, **item.model_dump(exclude={"id"}, exclude_none=True), "updated_at": now}
+        for item in items
+        if item.id in owned
+    ]
+    if rows:
+        change_id = record_change(db, current_user.organization_id)
+        db.execute(update(model), rows)
+        # Bulk UPDATE by primary key takes literal values only, so bump versions in one pass.
+        db.execute(
+            update(model)
+            .where(model.id.in_([row["id"] for row in rows]))
+            .values(version=model.version + 1, change_id=change_id)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    
+    if rows:
+        invalidate_lists(model, current_user.organization_id)
+    for row in rows:
+        publish_change(model, current_user.organization_id, "updated", {"id": row["id"]})
+    
+    return [
+        BulkItemResult(id=item.id, status="updated" if item.id in owned else "not_found")
+        for item in items
+    ]
+
+
+def _bulk_delete(db: Session, model, payload: BulkDelete, current_user: User) -> List[BulkItemResult]:
+    _check_batch_size(payload.ids)
+    
+    owned = _owned_ids(db, model, payload.ids, current_user.organization_id)
+    if owned:
+        change_id = record_change(db, current_user.organization_id)
+        db.execute(delete(model).where(model.id.in_(owned)))
+        db.execute(tombstones_for(model, current_user.organization_id, sorted(owned), change_id))
+    db.commit()
+    
+    if owned:
+        invalidate_lists(model, current_user.organization_id)
+    for id in sorted(owned):
+        publish_change(model, current_user.organization_id, "deleted", {"id": id})
+    
+    return [
+        BulkItemResult(id=id, status="deleted" if id in owned else "not_found")
+        for id in payload.ids
+    ]
+
+
+@router.post("/notes/bulk", response_model=List[NoteResponse])
+def bulk_create_notes(
+    items: List[NoteCreate],
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    return _bulk_create(db, Note, NoteResponse, items, current_user)
+
+
+@router.patch("/notes/bulk", response_model=List[BulkItemResult])
+def bulk_update_notes(
+    items: List[NoteBulkUpdate],
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _bulk_update(db, Note, items, current_user)
+
+
+@router.delete("/notes/bulk", response_model=List[BulkItemResult])
+def bulk_delete_notes(
+    payload: BulkDelete,
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _bulk_delete(db, Note, payload, current_user)
+
+
+@router.post("/todos/bulk", response_model=List[TodoResponse])
+def bulk_create_todos(
+    items: List[TodoCreate],
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    return _bulk_create(db, Todo, TodoResponse, items, current_user)
+
+
+@router.patch("/todos/bulk", response_model=List[BulkItemResult])
+def bulk_update_todos(
+    items: List[TodoBulkUpdate],
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    return _bulk_update(db, Todo, items, current_user)
+
+
+@router.delete("/todos/bulk", response_model=List[BulkItemResult])
+def bulk_delete_todos(
+    payload: BulkDelete,
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _bulk_delete(db, Todo, payload, current_user)
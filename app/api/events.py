@@ -0,0 +1,38 @@
+import asyncio
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.events import Subscription, get_broker
+from app.deps import get_stream_principal
+from app.schemas.user import Principal
+
+router = APIRouter(tags=["events"])
+
+
+async def _event_stream(subscription: Subscription):
+    broker = get_broker()
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                message = await subscription.get(settings.events_keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            
+            if message is None:
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield message
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/events")
+async def events(current_user: Principal = Depends(get_stream_principal)):
+    subscription = get_broker().subscribe(current_user.organization_id)
+    return StreamingResponse(
+        _event_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,89 @@
+from typing import Iterator
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.pagination import page, seek
+from app.core.serialization import dumps, rows_to_dicts
+from app.database import get_db
+from app.deps import require_admin_role
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+router = APIRouter(tags=["export"])
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _export_statement(model, organization_id: int):
+    # Plain column rows instead of ORM entities, so nothing is tracked per row.
+    return select(
+        *model.__table__.columns,
+        User.username.label("created_by_username")
+    ).join(
+        User, model.created_by == User.id
+    ).where(
+        model.organization_id == organization_id
+    )
+
+
+def _export_batches(db: Session, model, organization_id: int) -> Iterator[tuple]:
+    # Keyset batches on (created_at, id) instead of a server-side cursor: drivers
+    # such as mysql-connector buffer the whole result set, a LIMITed query does not.
+    stmt = _export_statement(model, organization_id)
+    cursor = None
+    while True:
+        result = db.execute(seek(stmt, model, EXPORT_BATCH_SIZE, cursor))
+        keys = list(result.keys())
+        rows, cursor = page(result.all(), EXPORT_BATCH_SIZE)
+        if rows:
+            yield keys, rows
+        if cursor is None:
+            return
+
+
+def export_chunks(db: Session, model, organization_id: int, format: str = "ndjson") -> Iterator[bytes]:
+    if format == "json":
+        yield b"["
+    separator = b""
+    for keys, rows in _export_batches(db, model, organization_id):
+        lines = [dumps(item) for item in rows_to_dicts(keys, rows)]
+        if format == "json":
+            yield separator + b",".join(lines)
+            separator = b","
+        else:
+            yield b"\n".join(lines) + b"\n"
+    if format == "json":
+        yield b"]"
+
+
+def _export_response(db: Session, model, organization_id: int, format: str) -> StreamingResponse:
+    return StreamingResponse(
+        export_chunks(db, model, organization_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{model.__tablename__}.{format}"'}
+    )
+
+
+@router.get("/notes/export")
+def export_notes(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _export_response(db, Note, current_user.organization_id, format)
+
+
+@router.get("/todos/export")
+def export_todos(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _export_response(db, Todo, current_user.organization_id, format)
@@ -0,0 +1,140 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database import engine, async_engine
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+# Probes arrive from every load balancer node; one cached result per TTL keeps
+# them from turning into a query per probe. The last result outlives the TTL so
+# probes that arrive while the checks run can be answered without waiting.
+_readiness_cache = TTLCache(maxsize=2)
+_readiness_lock = threading.Lock()
+_pending_ping: Optional[Future] = None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _pool_check(pool) -> dict:
+    started = time.perf_counter()
+    if not isinstance(pool, QueuePool):
+        return {"status": "ok", "latency_ms": _elapsed_ms(started)}
+    
+    checked_out = pool.checkedout()
+    capacity = pool.size() + settings.db_max_overflow
+    saturation = checked_out / capacity if capacity else 0.0
+    return {
+        "status": "ok" if saturation < settings.health_pool_saturation_threshold else "saturated",
+        "latency_ms": _elapsed_ms(started),
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(saturation, 3),
+    }
+
+
+def _ping() -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _start_ping() -> Future:
+    future = Future()
+    
+    def run():
+        try:
+            _ping()
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+    
+    # A daemon thread, so a connect that never returns cannot hold up shutdown.
+    threading.Thread(target=run, name="health-ping", daemon=True).start()
+    return future
+
+
+def _database_check() -> dict:
+    global _pending_ping
+    started = time.perf_counter()
+    if _pending_ping is not None and not _pending_ping.done():
+        # The last ping is still stuck; report it instead of stacking another one.
+        return {"status": "timeout", "latency_ms": 0.0}
+    
+    _pending_ping = _start_ping()
+    try:
+        _pending_ping.result(timeout=settings.health_db_latency_threshold_ms / 1000)
+    except FutureTimeoutError:
+        return {"status": "timeout", "latency_ms": _elapsed_ms(started)}
+    except SQLAlchemyError as exc:
+        return {"status": "error", "latency_ms": _elapsed_ms(started), "error": type(exc).__name__}
+    
+    return {"status": "ok", "latency_ms": _elapsed_ms(started)}
+
+
+def _run_checks() -> dict:
+    checks = {"pool": _pool_check(engine.pool)}
+    if async_engine is not None:
+        checks["async_pool"] = _pool_check(async_engine.sync_engine.pool)
+    
+    if checks["pool"]["status"] == "saturated":
+        # A saturated pool would queue the ping behind real traffic; report it as is.
+        checks["database"] = {"status": "skipped", "latency_ms": 0.0}
+    else:
+        checks["database"] = _database_check()
+    
+    ready = all(check["status"] == "ok" for check in checks.values())
+    return {"status": "ready" if ready else "unready", "checked_at": time.time(), "checks": checks}
+
+
+def check_readiness() -> tuple:
+    result = _readiness_cache.get("ready")
+    if result is not None:
+        return result, True
+    
+    if not _readiness_lock.acquire(blocking=False):
+        # Another probe is running the checks; answer with the last result, or
+        # unready before there is one, rather than queue behind it.
+        result = _readiness_cache.get("last")
+        if result is None:
+            result = {"status": "unready", "checked_at": time.time(), "checks": {}}
+        return result, True
+    
+    try:
+        result = _readiness_cache.get("ready")
+        if result is not None:
+            return result, True
+        result = _run_checks()
+        _readiness_cache.set("ready", result, expires_at=time.time() + settings.health_cache_ttl)
+        _readiness_cache.set("last", result, expires_at=float("inf"))
+        return result, False
+    finally:
+        _readiness_lock.release()
+
+
+def clear_readiness_cache() -> None:
+    _readiness_cache.clear()
+
+
+@router.get("/live")
+def liveness():
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+def readiness():
+    result, cached = check_readiness()
+    return JSONResponse(
+        {**result, "cached": cached},
+        status_code=200 if result["status"] == "ready" else 503,
+        headers={"Cache-Control": "no-store"}
+    )
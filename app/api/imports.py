@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, UploadFile
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.list_cache import invalidate_lists
+from app.database import get_db
+from app.deps import require_admin_role
+from app.models.change import record_change
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+from app.schemas.bulk import ImportSummary
+from app.schemas.note import NoteCreate
+from app.schemas.todo import TodoCreate
+from typing import Iterator, Optional, Tuple, Type
+
+router = APIRouter(tags=["import"])
+
+
+def _import_format(upload: UploadFile, format: Optional[str]) -> str:
+    if format is not None:
+        return format
+    if (upload.filename or "").lower().endswith(".csv") or upload.content_type == "text/csv":
+        return "csv"
+    return "ndjson"
+
+
+def _read_rows(upload: UploadFile, format: str) -> Iterator[Tuple[int, object]]:
+    # The multipart parser has already spooled the upload; read it back line by line.
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8", newline="")
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def _describe_error(exc: ValueError) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+            for error in exc.errors()
+        )
+    return str(exc)
+
+
+def _insert_batch(db: Session, model, batch: list, organization_id: int) -> int:
+    change_id = record_change(db, organization_id)
+    db.execute(insert(model), [{**row, "change_id": change_id} for row in batch])
+    db.commit()
+    invalidate_lists(model, organization_id)
+    return len(batch)
+
+
+def _import_rows(db: Session, model, schema: Type[BaseModel], upload: UploadFile, format: str, current_user: User) -> dict:
+    imported = 0
+    errors = []
+    rejected = 0
+    batch = []
+    
+    try:
+        for line, raw in _read_rows(upload, format):
+            try:
+                item = schema.model_validate(json.loads(raw) if format == "ndjson" else raw)
+            except ValueError as exc:
+                rejected += 1
+                if len(errors) < settings.import_max_reported_errors:
+                    errors.append({"line": line, "error": _describe_error(exc)})
+                continue
+            
+            batch.append({
+                **item.model_dump(),
+                "organization_id": current_user.organization_id,
+                "created_by": current_user.id
+            })
+            if len(batch) >= settings.import_batch_size:
+                imported += _insert_batch(db, model, batch, current_user.organization_id)
+                batch = []
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload must be UTF-8 encoded. {imported} rows were imported before the invalid data."
+        )
+    
+    if batch:
+        imported += _insert_batch(db, model, batch, current_user.organization_id)
+    
+    if imported:
+        publish_change(model, current_user.organization_id, "imported", {"count": imported})
+    
+    return {"imported": imported, "rejected": rejected, "errors": errors}
+
+
+@router.post("/notes/import", response_model=ImportSummary)
+def import_notes(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _import_rows(db, Note, NoteCreate, file, _import_format(file, format), current_user)
+
+
+@router.post("/todos/import", response_model=ImportSummary)
+def import_todos(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(require_admin_role),
+    db: Session = Depends(get_db)
+):
+    return _import_rows(db, Todo, TodoCreate, file, _import_format(file, format), current_user)
@@ -1,93 +1,171 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
-from app.deps import get_current_user, require_admin_role
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.etag import etag_matches, expected_version, make_etag, version_lookup, versioned_delete, versioned_update
+from app.core.pagination import page, seek
+from app.core.list_cache import cached_list_response, invalidate_lists
+from app.core.fields import parse_fields, projected_columns
+from app.core.serialization import FastJSONResponse, list_response
+from app.deps import get_current_user, get_current_principal, require_admin_role
+from app.models.change import record_change
 from app.models.note import Note
+from app.models.tombstone import tombstones_for
 from app.models.user import User
-from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse, NoteWithUser
-from typing import List
+from app.schemas.user import Principal
+from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse, NoteWithUser, NotePage
+from typing import List, Optional, Union
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
+# List endpoints read these columns as plain rows and encode them directly,
+# skipping ORM entities and response_model validation.
+NOTE_LIST_COLUMNS = (
+    Note.title, Note.content, Note.id, Note.organization_id, Note.created_by,
+    Note.created_at, Note.updated_at, Note.version,
+    User.username.label("created_by_username"),
+)
 
-@router.get("/", response_model=List[NoteWithUser])
+NOTE_FIELDS = {column.key: column for column in NOTE_LIST_COLUMNS}
+NOTE_FIELDS["content_preview"] = func.substr(Note.content, 1, settings.content_preview_length).label("content_preview")
+
+
+def _note_to_dict(note: Note) -> dict:
+    return {
+        "id": note.id,
+        "title": note.title,
+        "content": note.content,
+        "organization_id": note.organization_id,
+        "created_by": note.created_by,
+        "created_at": note.created_at,
+        "updated_at": note.updated_at,
+        "version": note.version,
+        "created_by_username": note.created_by_user.username
+    }
+
+
+def _publish_note(action: str, note: Note) -> None:
+    publish_change(Note, note.organization_id, action, NoteResponse.model_validate(note).model_dump())
+
+
+def _note_rows(*criteria, fields: Optional[List[str]] = None):
+    if fields is None:
+        stmt = select(*NOTE_LIST_COLUMNS)
+    else:
+        stmt = select(*projected_columns(Note, NOTE_FIELDS, fields))
+    
+    if fields is None or "created_by_username" in fields:
+        stmt = stmt.join(User, Note.created_by == User.id)
+    return stmt.where(*criteria)
+
+
+def _note_list_response(db: Session, stmt, limit: Optional[int], cursor: Optional[str], fields: Optional[List[str]] = None):
+    if limit is None and cursor is None:
+        result = db.execute(stmt)
+        return list_response(fields or result.keys(), result, resource=Note.__tablename__)
+    
+    limit = limit or settings.default_page_size
+    result = db.execute(seek(stmt, Note, limit, cursor))
+    notes, next_cursor = page(result.all(), limit)
+    return list_response(fields or result.keys(), notes, paginated=True, next_cursor=next_cursor, resource=Note.__tablename__)
+
+
+@router.get("/", response_model=Union[List[NoteWithUser], NotePage])
 def get_notes(
-    current_user: User = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    notes = db.query(Note).filter(Note.organization_id == current_user.organization_id).all()
+    fields = parse_fields(fields, NOTE_FIELDS)
+    stmt = _note_rows(Note.organization_id == current_user.organization_id, fields=fields)
     
-    result = []
-    for note in notes:
-        note_dict = {
-            "id": note.id,
-            "title": note.title,
-            "content": note.content,
-            "organization_id": note.organization_id,
-            "created_by": note.created_by,
-            "created_at": note.created_at,
-            "updated_at": note.updated_at,
-            "created_by_username": note.created_by_user.username
-        }
-        result.append(note_dict)
-    
-    return result
+    return cached_list_response(
+        db, Note, current_user.organization_id, ("all", fields, limit, cursor),
+        lambda: _note_list_response(db, stmt, limit, cursor, fields)
+    )
 
 
-@router.get("/my-notes", response_model=List[NoteWithUser])
+@router.get("/my-notes", response_model=Union[List[NoteWithUser], NotePage])
 def get_my_notes(
-    current_user: User = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    notes = db.query(Note).filter(
+    fields = parse_fields(fields, NOTE_FIELDS)
+    stmt = _note_rows(
         Note.organization_id == current_user.organization_id,
-        Note.created_by == current_user.id
-    ).all()
-    
-    result = []
-    for note in notes:
-        note_dict = {
-            "id": note.id,
-            "title": note.title,
-            "content": note.content,
-            "organization_id": note.organization_id,
-            "created_by": note.created_by,
-            "created_at": note.created_at,
-            "updated_at": note.updated_at,
-            "created_by_username": note.created_by_user.username
-        }
-        result.append(note_dict)
+        Note.created_by == current_user.id,
+        fields=fields
+    )
     
-    return result
+    return cached_list_response(
+        db, Note, current_user.organization_id, ("user", current_user.id, fields, limit, cursor),
+        lambda: _note_list_response(db, stmt, limit, cursor, fields)
+    )
 
 
 @router.post("/", response_model=NoteResponse)
 def create_note(
     note_data: NoteCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    change_id = record_change(db, current_user.organization_id)
     note = Note(
         title=note_data.title,
         content=note_data.content,
         organization_id=current_user.organization_id,
-        created_by=current_user.id
+        created_by=current_user.id,
+        change_id=change_id
     )
     
     db.add(note)
     db.commit()
-    db.refresh(note)
     
+    invalidate_lists(Note, note.organization_id)
+    _publish_note("created", note)
+    response.headers["ETag"] = make_etag(note.version)
     return note
 
 
 @router.get("/{note_id}", response_model=NoteWithUser)
 def get_note(
     note_id: int,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    note = db.query(Note).filter(
+    fields = parse_fields(fields, NOTE_FIELDS)
+    if if_none_match is not None:
+        version = db.scalar(version_lookup(Note, note_id, current_user.organization_id))
+        if version is not None and etag_matches(if_none_match, make_etag(version)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(version)})
+    
+    if fields is not None:
+        row = db.execute(_note_rows(
+            Note.id == note_id,
+            Note.organization_id == current_user.organization_id,
+            fields=fields
+        )).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        return FastJSONResponse(dict(zip(fields, row)), headers={"ETag": make_etag(row.version)})
+    
+    note = db.query(Note).options(
+        joinedload(Note.created_by_user, innerjoin=True)
+    ).filter(
         Note.id == note_id,
         Note.organization_id == current_user.organization_id
     ).first()
@@ -98,65 +176,45 @@ def get_note(
             detail="Note not found"
         )
     
-    return {
-        "id": note.id,
-        "title": note.title,
-        "content": note.content,
-        "organization_id": note.organization_id,
-        "created_by": note.created_by,
-        "created_at": note.created_at,
-        "updated_at": note.updated_at,
-        "created_by_username": note.created_by_user.username
-    }
+    response.headers["ETag"] = make_etag(note.version)
+    return _note_to_dict(note)
 
 
 @router.put("/{note_id}", response_model=NoteResponse)
 def update_note(
     note_id: int,
     note_data: NoteUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(require_admin_role),
     db: Session = Depends(get_db)
 ):
-    note = db.query(Note).filter(
-        Note.id == note_id,
-        Note.organization_id == current_user.organization_id
-    ).first()
-    
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
-    
-    if note_data.title is not None:
-        note.title = note_data.title
-    if note_data.content is not None:
-        note.content = note_data.content
-    
+    change_id = record_change(db, current_user.organization_id)
+    note = versioned_update(
+        db, Note, note_id, current_user.organization_id,
+        expected_version(if_match), {**note_data.model_dump(exclude_none=True), "change_id": change_id}, "Note not found"
+    )
     db.commit()
-    db.refresh(note)
     
+    invalidate_lists(Note, note.organization_id)
+    _publish_note("updated", note)
+    response.headers["ETag"] = make_etag(note.version)
     return note
 
 
 @router.delete("/{note_id}")
 def delete_note(
     note_id: int,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(require_admin_role),
     db: Session = Depends(get_db)
 ):
-    note = db.query(Note).filter(
-        Note.id == note_id,
-        Note.organization_id == current_user.organization_id
-    ).first()
-    
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
-    
-    db.delete(note)
+    change_id = record_change(db, current_user.organization_id)
+    versioned_delete(db, Note, note_id, current_user.organization_id, expected_version(if_match), "Note not found")
+    db.execute(tombstones_for(Note, current_user.organization_id, [note_id], change_id))
     db.commit()
     
+    invalidate_lists(Note, current_user.organization_id)
+    publish_change(Note, current_user.organization_id, "deleted", {"id": note_id})
+    
     return {"message": "Note deleted successfully"}
@@ -1,29 +1,92 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import hashlib
+import json
+import time
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, aliased
 from app.database import get_db
-from app.deps import get_current_user, require_admin_role
-from app.models.organization import Organization
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.etag import etag_matches
+from app.core.pagination import paginate
+from app.core.security import revoke_user_tokens
+from app.deps import get_current_principal, require_admin_role
+from app.models.organization import Organization, OrganizationTrigram, name_trigrams
 from app.models.user import User, UserRole
-from app.schemas.organization import OrganizationResponse, OrganizationWithUsers
-from typing import List, Optional
+from app.schemas.organization import OrganizationResponse, OrganizationWithUsers, OrganizationSummary, OrganizationPage
+from app.schemas.user import Principal
+from typing import List, Optional, Union
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
+_search_cache = TTLCache(maxsize=1024)
+_public_cache = TTLCache(maxsize=256)
 
-@router.get("/me", response_model=OrganizationResponse)
-def get_my_organization(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    organization = db.query(Organization).filter(Organization.id == current_user.organization_id).first()
-    if not organization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found"
+INFIX_CANDIDATE_FACTOR = 5
+TRIGRAM_SAMPLE_SIZE = 1000
+
+
+def _normalize_search_term(q: str) -> str:
+    return q.strip().lower()
+
+
+def _prefix_search_query(term: str, limit: int):
+    # A half-open range on the lowercased name is index-backed on every dialect.
+    upper_bound = term[:-1] + chr(ord(term[-1]) + 1)
+    return select(Organization).where(
+        Organization.search_name >= term,
+        Organization.search_name < upper_bound
+    ).order_by(Organization.search_name).limit(limit)
+
+
+def _trigram_counts_query(trigrams: List[str]):
+    # Postings per trigram, counted only up to a cap: enough to tell a rare trigram
+    # from a common one without walking the long lists.
+    def capped_count(trigram: str):
+        sample = select(OrganizationTrigram.organization_id).where(
+            OrganizationTrigram.trigram == trigram
+        ).limit(TRIGRAM_SAMPLE_SIZE).subquery()
+        return select(func.count()).select_from(sample).scalar_subquery()
+    
+    return select(*(capped_count(trigram) for trigram in trigrams))
+
+
+def _infix_search_query(term: str, driver_trigram: str, limit: int, exclude: List[int]):
+    # Walk the rarest trigram's postings and probe the rest through the primary key
+    # instead of intersecting every list. Postings come back in primary key order,
+    # so the walk stops after a bounded, deterministic set of verified candidates.
+    driver = aliased(OrganizationTrigram)
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    query = select(Organization).join(driver, driver.organization_id == Organization.id).where(
+        driver.trigram == driver_trigram,
+        Organization.search_name.like(f"%{escaped}%", escape="\\")
+    )
+    for trigram in sorted(name_trigrams(term) - {driver_trigram}):
+        posting = aliased(OrganizationTrigram)
+        query = query.where(
+            exists().where(posting.trigram == trigram, posting.organization_id == driver.organization_id)
         )
-    return organization
+    if exclude:
+        query = query.where(Organization.id.notin_(exclude))
+    return query.order_by(driver.organization_id).limit(limit * INFIX_CANDIDATE_FACTOR)
+
+
+def _rarest_trigram(trigrams: List[str], counts) -> Optional[str]:
+    count, trigram = min(zip(counts, trigrams))
+    return trigram if count else None
+
 
+def _rank_infix_matches(organizations: List[Organization], limit: int) -> List[Organization]:
+    # Shortest names first among the candidates; with more matches than candidates
+    # this is a best-effort ranking rather than the global shortest.
+    return sorted(organizations, key=lambda org: (len(org.search_name), org.search_name))[:limit]
 
-@router.get("/public", response_model=List[dict])
-def get_public_organizations(db: Session = Depends(get_db)):
-    organizations = db.query(Organization).all()
+
+def _organization_summaries(organizations: List[Organization]) -> List[dict]:
     return [
         {
             "id": org.id,
@@ -34,17 +97,111 @@ def get_public_organizations(db: Session = Depends(get_db)):
     ]
 
 
+def invalidate_public_organizations() -> None:
+    _public_cache.clear()
+
+
+def _public_listing(organizations: List[Organization], paginated: bool = False, next_cursor: Optional[str] = None) -> dict:
+    items = _organization_summaries(organizations)
+    content = {"items": items, "next_cursor": next_cursor} if paginated else items
+    body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+    
+    last_modified = max((org.created_at for org in organizations), default=None)
+    return {
+        "body": body,
+        "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+        "last_modified": last_modified.replace(tzinfo=timezone.utc) if last_modified else None
+    }
+
+
+def _not_modified(request: Request, listing: dict) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, listing["etag"])
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and listing["last_modified"] is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return listing["last_modified"].replace(microsecond=0) <= since
+    
+    return False
+
+
+def _conditional_response(request: Request, listing: dict) -> Response:
+    headers = {"ETag": listing["etag"], "Cache-Control": "public, no-cache"}
+    if listing["last_modified"] is not None:
+        headers["Last-Modified"] = format_datetime(listing["last_modified"], usegmt=True)
+    
+    if _not_modified(request, listing):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=listing["body"], media_type="application/json", headers=headers)
+
+
+@router.get("/me", response_model=OrganizationResponse)
+def get_my_organization(current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    organization = db.query(Organization).filter(Organization.id == current_user.organization_id).first()
+    if not organization:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
+        )
+    return organization
+
+
+@router.get("/public", response_model=Union[List[OrganizationSummary], OrganizationPage])
+def get_public_organizations(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    cache_key = (limit, cursor)
+    listing = _public_cache.get(cache_key)
+    if listing is None:
+        query = db.query(Organization)
+        if limit is None and cursor is None:
+            listing = _public_listing(query.all())
+        else:
+            organizations, next_cursor = paginate(query, Organization, limit or settings.default_page_size, cursor)
+            listing = _public_listing(organizations, paginated=True, next_cursor=next_cursor)
+        _public_cache.set(cache_key, listing, expires_at=time.time() + settings.public_organizations_cache_ttl)
+    
+    return _conditional_response(request, listing)
+
+
 @router.get("/search", response_model=List[dict])
-def search_organizations(q: str = Query(..., min_length=1), db: Session = Depends(get_db)):
-    organizations = db.query(Organization).filter(Organization.name.ilike(f"%{q}%")).all()
-    return [
-        {
-            "id": org.id,
-            "name": org.name,
-            "created_at": org.created_at
-        }
-        for org in organizations
-    ]
+def search_organizations(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(settings.organization_search_limit, ge=1, le=settings.organization_search_max_limit),
+    db: Session = Depends(get_db)
+):
+    response.headers["Cache-Control"] = f"public, max-age={settings.organization_search_cache_ttl}"
+    term = _normalize_search_term(q)
+    if not term:
+        return []
+    
+    cache_key = (term, limit)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    organizations = list(db.scalars(_prefix_search_query(term, limit)).all())
+    if len(organizations) < limit and len(term) >= 3:
+        exclude = [org.id for org in organizations]
+        remaining = limit - len(organizations)
+        trigrams = sorted(name_trigrams(term))
+        driver_trigram = _rarest_trigram(trigrams, db.execute(_trigram_counts_query(trigrams)).one())
+        if driver_trigram is not None:
+            infix = db.scalars(_infix_search_query(term, driver_trigram, remaining, exclude)).all()
+            organizations += _rank_infix_matches(infix, remaining)
+    
+    result = _organization_summaries(organizations)
+    _search_cache.set(cache_key, result, expires_at=time.time() + settings.organization_search_cache_ttl)
+    return result
 
 
 @router.get("/{organization_id}/users", response_model=List[dict])
@@ -103,7 +260,9 @@ def update_user_role(
         )
     
     user.role = role
+    user.token_version = User.token_version + 1
     db.commit()
+    revoke_user_tokens(user.id)
     
     return {"message": f"User {user.username} role updated to {role.value}"}
 
@@ -140,5 +299,6 @@ def remove_user_from_organization(
     
     db.delete(user)
     db.commit()
+    revoke_user_tokens(user.id)
     
     return {"message": f"User {user.username} removed from organization"}
@@ -0,0 +1,63 @@
+import re
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import column, or_, select, table, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session, joinedload
+from app.api.notes import _note_to_dict
+from app.core.config import settings
+from app.database import get_db
+from app.deps import get_current_principal
+from app.models.note import Note, NOTES_FTS_TABLE
+from app.schemas.note import NoteWithUser
+from app.schemas.user import Principal
+from typing import List
+
+router = APIRouter(tags=["search"])
+
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+MAX_SEARCH_TERMS = 16
+
+notes_fts = table(NOTES_FTS_TABLE, column("rowid"), column("rank"))
+
+
+def _search_terms(q: str) -> List[str]:
+    return SEARCH_TERM_PATTERN.findall(q.lower())[:MAX_SEARCH_TERMS]
+
+
+def _ranked_notes_query(dialect: str, terms: List[str]):
+    query = select(Note).options(joinedload(Note.created_by_user, innerjoin=True))
+    
+    if dialect == "sqlite":
+        expression = " ".join(f'"{term}"*' for term in terms)
+        return query.join(notes_fts, notes_fts.c.rowid == Note.id).where(
+            text(f"{NOTES_FTS_TABLE} MATCH :expression").bindparams(expression=expression)
+        ).order_by(notes_fts.c.rank, Note.id)
+    
+    if dialect == "mysql":
+        score = match(Note.title, Note.content, against=" ".join(f"+{term}*" for term in terms)).in_boolean_mode()
+        return query.where(score > 0).order_by(score.desc(), Note.id)
+    
+    conditions = [
+        or_(Note.title.ilike(f"%{term}%"), Note.content.ilike(f"%{term}%"))
+        for term in terms
+    ]
+    return query.where(*conditions).order_by(Note.id.desc())
+
+
+@router.get("/notes/search", response_model=List[NoteWithUser])
+def search_notes(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    offset: int = Query(0, ge=0),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    terms = _search_terms(q)
+    if not terms:
+        return []
+    
+    query = _ranked_notes_query(db.get_bind().dialect.name, terms).where(
+        Note.organization_id == current_user.organization_id
+    ).limit(limit).offset(offset)
+    
+    return [_note_to_dict(note) for note in db.scalars(query)]
@@ -0,0 +1,116 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload
+from app.api.notes import _note_to_dict
+from app.api.todos import _todo_to_dict
+from app.core.config import settings
+from app.database import get_db
+from app.deps import get_current_principal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.tombstone import Tombstone
+from app.schemas.sync import SyncResponse
+from app.schemas.user import Principal
+from typing import List, Optional, Tuple
+
+router = APIRouter(tags=["sync"])
+
+SYNC_STREAMS = ("notes", "todos", "deleted")
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid sync token"
+    )
+
+
+def _decode_position(position: str) -> Optional[Tuple[int, int]]:
+    if not position:
+        return None
+    
+    try:
+        change_id, id = position.split("-")
+        return int(change_id), int(id)
+    except ValueError:
+        raise _invalid_token()
+
+
+def _decode_token(token: Optional[str]) -> List[Optional[Tuple[int, int]]]:
+    if token is None:
+        return [None] * len(SYNC_STREAMS)
+    
+    positions = token.split(".")
+    if len(positions) != len(SYNC_STREAMS):
+        raise _invalid_token()
+    
+    return [_decode_position(position) for position in positions]
+
+
+def _encode_token(positions: List[Optional[Tuple[int, int]]]) -> str:
+    return ".".join(f"{position[0]}-{position[1]}" if position else "" for position in positions)
+
+
+def _changes(query, model, limit: int, position: Optional[Tuple[int, int]]):
+    # change_id is drawn under the organization's row lock (app.models.change), so
+    # a position never moves past a write that has yet to commit.
+    if position is not None:
+        change_id, id = position
+        query = query.filter(
+            model.change_id >= change_id,
+            or_(
+                model.change_id > change_id,
+                and_(model.change_id == change_id, model.id > id)
+            )
+        )
+    rows = query.order_by(model.change_id, model.id).limit(limit + 1).all()
+    
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        position = (rows[-1].change_id, rows[-1].id)
+    
+    return rows, position, has_more
+
+
+@router.get("/sync", response_model=SyncResponse)
+def sync(
+    since: Optional[str] = None,
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    notes_position, todos_position, deleted_position = _decode_token(since)
+    organization_id = current_user.organization_id
+    
+    notes, notes_position, more_notes = _changes(
+        db.query(Note).options(
+            joinedload(Note.created_by_user, innerjoin=True)
+        ).filter(Note.organization_id == organization_id),
+        Note, limit, notes_position
+    )
+    todos, todos_position, more_todos = _changes(
+        db.query(Todo).options(
+            joinedload(Todo.created_by_user, innerjoin=True)
+        ).filter(Todo.organization_id == organization_id),
+        Todo, limit, todos_position
+    )
+    tombstones, deleted_position, more_deleted = _changes(
+        db.query(Tombstone).filter(Tombstone.organization_id == organization_id),
+        Tombstone, limit, deleted_position
+    )
+    
+    return {
+        "notes": [_note_to_dict(note) for note in notes],
+        "todos": [_todo_to_dict(todo) for todo in todos],
+        "deleted": [
+            {
+                "resource_type": tombstone.resource_type,
+                "id": tombstone.resource_id,
+                "deleted_at": tombstone.deleted_at
+            }
+            for tombstone in tombstones
+        ],
+        "next_token": _encode_token([notes_position, todos_position, deleted_position]),
+        "has_more": more_notes or more_todos or more_deleted
+    }
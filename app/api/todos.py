@@ -1,93 +1,170 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
-from app.deps import get_current_user, require_admin_role
+from app.core.config import settings
+from app.core.events import publish_change
+from app.core.etag import etag_matches, expected_version, make_etag, version_lookup, versioned_delete, versioned_update
+from app.core.pagination import page, seek
+from app.core.list_cache import cached_list_response, invalidate_lists
+from app.core.fields import parse_fields, projected_columns
+from app.core.serialization import FastJSONResponse, list_response
+from app.deps import get_current_user, get_current_principal, require_admin_role
+from app.models.change import record_change
 from app.models.todo import Todo
+from app.models.tombstone import tombstones_for
 from app.models.user import User
-from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse, TodoWithUser
-from typing import List
+from app.schemas.user import Principal
+from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse, TodoWithUser, TodoPage
+from typing import List, Optional, Union
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+# List endpoints read these columns as plain rows and encode them directly,
+# skipping ORM entities and response_model validation.
+TODO_LIST_COLUMNS = (
+    Todo.title, Todo.completed, Todo.id, Todo.organization_id, Todo.created_by,
+    Todo.created_at, Todo.updated_at, Todo.version,
+    User.username.label("created_by_username"),
+)
 
-@router.get("/", response_model=List[TodoWithUser])
+TODO_FIELDS = {column.key: column for column in TODO_LIST_COLUMNS}
+
+
+def _todo_to_dict(todo: Todo) -> dict:
+    return {
+        "id": todo.id,
+        "title": todo.title,
+        "completed": todo.completed,
+        "organization_id": todo.organization_id,
+        "created_by": todo.created_by,
+        "created_at": todo.created_at,
+        "updated_at": todo.updated_at,
+        "version": todo.version,
+        "created_by_username": todo.created_by_user.username
+    }
+
+
+def _publish_todo(action: str, todo: Todo) -> None:
+    publish_change(Todo, todo.organization_id, action, TodoResponse.model_validate(todo).model_dump())
+
+
+def _todo_rows(*criteria, fields: Optional[List[str]] = None):
+    if fields is None:
+        stmt = select(*TODO_LIST_COLUMNS)
+    else:
+        stmt = select(*projected_columns(Todo, TODO_FIELDS, fields))
+    
+    if fields is None or "created_by_username" in fields:
+        stmt = stmt.join(User, Todo.created_by == User.id)
+    return stmt.where(*criteria)
+
+
+def _todo_list_response(db: Session, stmt, limit: Optional[int], cursor: Optional[str], fields: Optional[List[str]] = None):
+    if limit is None and cursor is None:
+        result = db.execute(stmt)
+        return list_response(fields or result.keys(), result, resource=Todo.__tablename__)
+    
+    limit = limit or settings.default_page_size
+    result = db.execute(seek(stmt, Todo, limit, cursor))
+    todos, next_cursor = page(result.all(), limit)
+    return list_response(fields or result.keys(), todos, paginated=True, next_cursor=next_cursor, resource=Todo.__tablename__)
+
+
+@router.get("/", response_model=Union[List[TodoWithUser], TodoPage])
 def get_todos(
-    current_user: User = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    todos = db.query(Todo).filter(Todo.organization_id == current_user.organization_id).all()
+    fields = parse_fields(fields, TODO_FIELDS)
+    stmt = _todo_rows(Todo.organization_id == current_user.organization_id, fields=fields)
     
-    result = []
-    for todo in todos:
-        todo_dict = {
-            "id": todo.id,
-            "title": todo.title,
-            "completed": todo.completed,
-            "organization_id": todo.organization_id,
-            "created_by": todo.created_by,
-            "created_at": todo.created_at,
-            "updated_at": todo.updated_at,
-            "created_by_username": todo.created_by_user.username
-        }
-        result.append(todo_dict)
-    
-    return result
+    return cached_list_response(
+        db, Todo, current_user.organization_id, ("all", fields, limit, cursor),
+        lambda: _todo_list_response(db, stmt, limit, cursor, fields)
+    )
 
 
-@router.get("/my-todos", response_model=List[TodoWithUser])
+@router.get("/my-todos", response_model=Union[List[TodoWithUser], TodoPage])
 def get_my_todos(
-    current_user: User = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    todos = db.query(Todo).filter(
+    fields = parse_fields(fields, TODO_FIELDS)
+    stmt = _todo_rows(
         Todo.organization_id == current_user.organization_id,
-        Todo.created_by == current_user.id
-    ).all()
-    
-    result = []
-    for todo in todos:
-        todo_dict = {
-            "id": todo.id,
-            "title": todo.title,
-            "completed": todo.completed,
-            "organization_id": todo.organization_id,
-            "created_by": todo.created_by,
-            "created_at": todo.created_at,
-            "updated_at": todo.updated_at,
-            "created_by_username": todo.created_by_user.username
-        }
-        result.append(todo_dict)
+        Todo.created_by == current_user.id,
+        fields=fields
+    )
     
-    return result
+    return cached_list_response(
+        db, Todo, current_user.organization_id, ("user", current_user.id, fields, limit, cursor),
+        lambda: _todo_list_response(db, stmt, limit, cursor, fields)
+    )
 
 
 @router.post("/", response_model=TodoResponse)
 def create_todo(
     todo_data: TodoCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    change_id = record_change(db, current_user.organization_id)
     todo = Todo(
         title=todo_data.title,
         completed=todo_data.completed,
         organization_id=current_user.organization_id,
-        created_by=current_user.id
+        created_by=current_user.id,
+        change_id=change_id
     )
     
     db.add(todo)
     db.commit()
-    db.refresh(todo)
     
+    invalidate_lists(Todo, todo.organization_id)
+    _publish_todo("created", todo)
+    response.headers["ETag"] = make_etag(todo.version)
     return todo
 
 
 @router.get("/{todo_id}", response_model=TodoWithUser)
 def get_todo(
     todo_id: int,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    todo = db.query(Todo).filter(
+    fields = parse_fields(fields, TODO_FIELDS)
+    if if_none_match is not None:
+        version = db.scalar(version_lookup(Todo, todo_id, current_user.organization_id))
+        if version is not None and etag_matches(if_none_match, make_etag(version)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(version)})
+    
+    if fields is not None:
+        row = db.execute(_todo_rows(
+            Todo.id == todo_id,
+            Todo.organization_id == current_user.organization_id,
+            fields=fields
+        )).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Todo not found"
+            )
+        return FastJSONResponse(dict(zip(fields, row)), headers={"ETag": make_etag(row.version)})
+    
+    todo = db.query(Todo).options(
+        joinedload(Todo.created_by_user, innerjoin=True)
+    ).filter(
         Todo.id == todo_id,
         Todo.organization_id == current_user.organization_id
     ).first()
@@ -98,65 +175,45 @@ def get_todo(
             detail="Todo not found"
         )
     
-    return {
-        "id": todo.id,
-        "title": todo.title,
-        "completed": todo.completed,
-        "organization_id": todo.organization_id,
-        "created_by": todo.created_by,
-        "created_at": todo.created_at,
-        "updated_at": todo.updated_at,
-        "created_by_username": todo.created_by_user.username
-    }
+    response.headers["ETag"] = make_etag(todo.version)
+    return _todo_to_dict(todo)
 
 
 @router.put("/{todo_id}", response_model=TodoResponse)
 def update_todo(
     todo_id: int,
     todo_data: TodoUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.organization_id == current_user.organization_id
-    ).first()
-    
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found"
-        )
-    
-    if todo_data.title is not None:
-        todo.title = todo_data.title
-    if todo_data.completed is not None:
-        todo.completed = todo_data.completed
-    
+    change_id = record_change(db, current_user.organization_id)
+    todo = versioned_update(
+        db, Todo, todo_id, current_user.organization_id,
+        expected_version(if_match), {**todo_data.model_dump(exclude_none=True), "change_id": change_id}, "Todo not found"
+    )
     db.commit()
-    db.refresh(todo)
     
+    invalidate_lists(Todo, todo.organization_id)
+    _publish_todo("updated", todo)
+    response.headers["ETag"] = make_etag(todo.version)
     return todo
 
 
 @router.delete("/{todo_id}")
 def delete_todo(
     todo_id: int,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(require_admin_role),
     db: Session = Depends(get_db)
 ):
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.organization_id == current_user.organization_id
-    ).first()
-    
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found"
-        )
-    
-    db.delete(todo)
+    change_id = record_change(db, current_user.organization_id)
+    versioned_delete(db, Todo, todo_id, current_user.organization_id, expected_version(if_match), "Todo not found")
+    db.execute(tombstones_for(Todo, current_user.organization_id, [todo_id], change_id))
     db.commit()
     
+    invalidate_lists(Todo, current_user.organization_id)
+    publish_change(Todo, current_user.organization_id, "deleted", {"id": todo_id})
+    
     return {"message": "Todo deleted successfully"}
@@ -5,12 +5,47 @@ from urllib.parse import quote_plus
 
 class Settings(BaseSettings):
     database_url: str = "mysql+mysqlconnector://root:" + quote_plus("QWer12@*") + "@localhost:3306/fastapi_backend"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 300
+    db_pool_pre_ping: bool = True
+    health_cache_ttl: float = 2.0
+    health_db_latency_threshold_ms: float = 250.0
+    health_pool_saturation_threshold: float = 0.9
+    async_database: bool = False
+    async_database_url: Optional[str] = None
     jwt_secret_key: str = "your-super-secret-jwt-key-change-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440
+    token_cache_size: int = 10000
+    token_version_cache_ttl: float = 5.0
+    password_hash_workers: int = 2
+    password_hash_queue_timeout: float = 5.0
     api_v1_str: str = "/api/v1"
     project_name: str = "FastAPI Backend"
     backend_cors_origins: list = ["http://localhost:3000", "http://localhost:8080"]
+    slow_request_ms: float = 500.0
+    slow_request_max_statements: int = 50
+    request_query_warning_threshold: int = 25
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    default_page_size: int = 50
+    max_page_size: int = 500
+    content_preview_length: int = 200
+    list_cache_size: int = 2048
+    list_cache_ttl: int = 30
+    list_cache_max_body_bytes: int = 1048576
+    bulk_max_items: int = 500
+    import_batch_size: int = 1000
+    import_max_reported_errors: int = 100
+    events_queue_size: int = 100
+    events_keepalive_seconds: float = 15.0
+    organization_search_limit: int = 10
+    organization_search_max_limit: int = 50
+    organization_search_cache_ttl: int = 30
+    public_organizations_cache_ttl: int = 60
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,115 @@
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+CODING_SUFFIXES = ("-gzip", "-br")
+
+
+def make_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _without_coding(tag: str) -> str:
+    # Compressed responses name their coding inside the tag; it is the same version.
+    for suffix in CODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return f'{tag[:-len(suffix) - 1]}"'
+    return tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    # If-None-Match uses weak comparison, so a W/ prefix does not matter.
+    tags = [_without_coding(tag.strip().removeprefix("W/")) for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def expected_version(if_match: Optional[str]) -> Optional[int]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    
+    try:
+        return int(_without_coding(if_match.strip()).strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Precondition failed"
+        )
+
+
+def version_lookup(model, id: int, organization_id: int):
+    return select(model.version).where(
+        model.id == id,
+        model.organization_id == organization_id
+    )
+
+
+def _scoped(statement, model, id: int, organization_id: int, version: Optional[int]):
+    statement = statement.where(
+        model.id == id,
+        model.organization_id == organization_id
+    )
+    if version is not None:
+        statement = statement.where(model.version == version)
+    
+    return statement.execution_options(synchronize_session=False)
+
+
+def _update_statement(model, id: int, organization_id: int, version: Optional[int], values: dict):
+    return _scoped(update(model), model, id, organization_id, version).values(
+        **values,
+        version=model.version + 1
+    )
+
+
+def _write_failed(current_version: Optional[int], detail: str) -> HTTPException:
+    if current_version is None:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
+    
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Resource has been modified"
+    )
+
+
+def versioned_update(db: Session, model, id: int, organization_id: int, version: Optional[int], values: dict, detail: str):
+    statement = _update_statement(model, id, organization_id, version, values)
+    if db.get_bind().dialect.update_returning:
+        obj = db.scalars(statement.returning(model)).first()
+    else:
+        obj = db.get(model, id) if db.execute(statement).rowcount else None
+    
+    if obj is None:
+        raise _write_failed(db.scalar(version_lookup(model, id, organization_id)), detail)
+    
+    return obj
+
+
+def versioned_delete(db: Session, model, id: int, organization_id: int, version: Optional[int], detail: str) -> None:
+    if not db.execute(_scoped(delete(model), model, id, organization_id, version)).rowcount:
+        raise _write_failed(db.scalar(version_lookup(model, id, organization_id)), detail)
+
+
+async def versioned_update_async(db: AsyncSession, model, id: int, organization_id: int, version: Optional[int], values: dict, detail: str):
+    statement = _update_statement(model, id, organization_id, version, values)
+    if db.get_bind().dialect.update_returning:
+        obj = (await db.scalars(statement.returning(model))).first()
+    else:
+        obj = await db.get(model, id) if (await db.execute(statement)).rowcount else None
+    
+    if obj is None:
+        raise _write_failed(await db.scalar(version_lookup(model, id, organization_id)), detail)
+    
+    return obj
+
+
+async def versioned_delete_async(db: AsyncSession, model, id: int, organization_id: int, version: Optional[int], detail: str) -> None:
+    if not (await db.execute(_scoped(delete(model), model, id, organization_id, version))).rowcount:
+        raise _write_failed(await db.scalar(version_lookup(model, id, organization_id)), detail)
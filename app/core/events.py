@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Set
+from fastapi.encoders import jsonable_encoder
+from app.core.config import settings
+
+
+def format_event(event: str, data: dict) -> str:
+    payload = json.dumps(jsonable_encoder(data), separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    def __init__(self, organization_id: int, maxsize: int):
+        self.organization_id = organization_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = asyncio.get_running_loop()
+        self.overflowed = False
+    
+    def offer(self, message: str) -> None:
+        if self.overflowed:
+            return
+        
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A consumer that cannot keep up is cut loose instead of stalling the fan-out;
+            # it reconnects and catches up through /sync.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+    
+    async def get(self, timeout: float) -> Optional[str]:
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class Broker(ABC):
+    # publish() hands an event to every worker; deliver() fans it out to this
+    # worker's subscribers. Cross-worker brokers call deliver() from their listener.
+    @abstractmethod
+    def subscribe(self, organization_id: int) -> Subscription:
+        ...
+    
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        ...
+    
+    @abstractmethod
+    def publish(self, organization_id: int, event: str, data: dict) -> None:
+        ...
+    
+    @abstractmethod
+    def deliver(self, organization_id: int, event: str, data: dict) -> None:
+        ...
+    
+    @abstractmethod
+    def subscriber_count(self) -> int:
+        ...
+
+
+class InMemoryBroker(Broker):
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+    
+    def subscribe(self, organization_id: int) -> Subscription:
+        subscription = Subscription(organization_id, self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(organization_id, set()).add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.organization_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.organization_id]
+    
+    def publish(self, organization_id: int, event: str, data: dict) -> None:
+        self.deliver(organization_id, event, data)
+    
+    def deliver(self, organization_id: int, event: str, data: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(organization_id, ()))
+        if not subscriptions:
+            return
+        
+        message = format_event(event, data)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+    
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+_broker: Broker = InMemoryBroker(settings.events_queue_size)
+
+
+def get_broker() -> Broker:
+    return _broker
+
+
+def set_broker(broker: Broker) -> None:
+    global _broker
+    _broker = broker
+
+
+def publish_change(model, organization_id: int, action: str, data: dict) -> None:
+    _broker.publish(organization_id, f"{model.__name__.lower()}.{action}", data)
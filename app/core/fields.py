@@ -0,0 +1,24 @@
+from typing import Dict, List, Optional
+from fastapi import HTTPException, status
+
+
+def parse_fields(fields: Optional[str], available: Dict[str, object]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in available]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested"
+        )
+    
+    return requested
+
+
+def projected_columns(model, available: Dict[str, object], fields: List[str]) -> list:
+    # Keyset pagination and ETags need these; they ride along after the requested
+    # columns and fall away when rows are zipped with the requested field names.
+    row_keys = [column for column in (model.created_at, model.id, model.version) if column.key not in fields]
+    return [available[name] for name in fields] + row_keys
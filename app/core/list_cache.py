@@ -0,0 +1,137 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core import metrics
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class ListCache(ABC):
+    # Entries are keyed by the organization's current generation, so a write only
+    # has to bump the counter: stale entries are never read again and age out.
+    # Shared backends must keep the counters in the shared store as well.
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+    
+    @abstractmethod
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        ...
+    
+    @abstractmethod
+    def generation(self, namespace: str) -> int:
+        ...
+    
+    @abstractmethod
+    def bump(self, namespace: str) -> int:
+        ...
+    
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class InMemoryListCache(ListCache):
+    def __init__(self, maxsize: int):
+        self._entries = TTLCache(maxsize=maxsize)
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.invalidations = 0
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+    
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        self._entries.set(key, body, expires_at=time.time() + ttl)
+    
+    def generation(self, namespace: str) -> int:
+        with self._lock:
+            return self._generations.get(namespace, 0)
+    
+    def bump(self, namespace: str) -> int:
+        with self._lock:
+            self.invalidations += 1
+            generation = self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            return generation
+    
+    def stats(self) -> dict:
+        with self._lock:
+            invalidations = self.invalidations
+        return {**self._entries.stats(), "invalidations": invalidations}
+
+
+_list_cache: ListCache = InMemoryListCache(settings.list_cache_size)
+
+
+def get_list_cache() -> ListCache:
+    return _list_cache
+
+
+def set_list_cache(cache: ListCache) -> None:
+    global _list_cache
+    _list_cache = cache
+
+
+def list_cache_stats() -> dict:
+    return _list_cache.stats()
+
+
+# Hits and misses are counted per lookup by list_cache_lookups_total.
+metrics.register_stats(
+    "list_cache", "List response cache",
+    list_cache_stats, gauges=("size", "maxsize"), counters=("evictions", "invalidations")
+)
+
+
+def _namespace(model, organization_id: int) -> str:
+    return f"{model.__tablename__}:{organization_id}"
+
+
+def invalidate_lists(model, organization_id: int) -> None:
+    _list_cache.bump(_namespace(model, organization_id))
+
+
+def _lookup(model, organization_id: int, variant: tuple):
+    namespace = _namespace(model, organization_id)
+    # Read the generation before querying: a write that lands meanwhile bumps it,
+    # so whatever this request stores is filed under a key nobody reads again.
+    key = f"{namespace}:{_list_cache.generation(namespace)}:{_variant_key(variant)}"
+    body = _list_cache.get(key)
+    metrics.list_cache_lookups.labels("miss" if body is None else "hit").inc()
+    if body is not None:
+        return key, Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+    return key, None
+
+
+def _store(key: str, response: Response) -> Response:
+    if len(response.body) <= settings.list_cache_max_body_bytes:
+        _list_cache.set(key, response.body, settings.list_cache_ttl)
+    response.headers["X-Cache"] = "MISS"
+    return response
+
+
+def cached_list_response(db: Session, model, organization_id: int, variant: tuple, build: Callable[[], Response]) -> Response:
+    key, cached = _lookup(model, organization_id, variant)
+    if cached is not None:
+        return cached
+    # Under REPEATABLE READ the authentication lookup already pinned a snapshot
+    # that may predate the generation just read; end it so the list query sees
+    # at least every write that generation accounts for.
+    db.commit()
+    return _store(key, build())
+
+
+async def cached_list_response_async(db: AsyncSession, model, organization_id: int, variant: tuple, build: Callable[[], Awaitable[Response]]) -> Response:
+    key, cached = _lookup(model, organization_id, variant)
+    if cached is not None:
+        return cached
+    await db.commit()
+    return _store(key, await build())
+
+
+def _variant_key(variant: tuple) -> str:
+    return "|".join("" if part is None else ",".join(part) if isinstance(part, list) else str(part) for part in variant)
@@ -0,0 +1,117 @@
+import os
+from typing import Callable, Dict, Iterable, List
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+# With PROMETHEUS_MULTIPROC_DIR set (and emptied before the workers start), every
+# worker writes its samples to that directory and /metrics aggregates them all.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_requests = Counter(
+    "http_requests_total", "HTTP requests handled.",
+    ["method", "route", "status"]
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+http_request_db_statements = Counter(
+    "http_request_db_statements_total", "SQL statements executed while handling requests.",
+    ["method", "route"]
+)
+http_request_db_seconds = Counter(
+    "http_request_db_seconds_total", "Time spent in SQL statements while handling requests.",
+    ["method", "route"]
+)
+
+db_pool_checkouts = Counter("db_pool_checkouts_total", "Connections checked out of the pool.", ["pool"])
+db_pool_checkout_timeouts = Counter("db_pool_checkout_timeouts_total", "Pool checkouts that timed out.", ["pool"])
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.",
+    ["pool"], buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+db_pool_checked_out = Gauge(
+    "db_pool_connections_checked_out", "Connections currently checked out.",
+    ["pool"], multiprocess_mode="livesum"
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow_connections", "Connections open beyond pool_size.",
+    ["pool"], multiprocess_mode="livesum"
+)
+
+password_verify_duration = Histogram(
+    "password_verify_seconds", "Time spent checking a password against its bcrypt hash.",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0)
+)
+token_decode_failures = Counter("jwt_decode_failures_total", "Bearer tokens that failed to decode.", ["reason"])
+
+list_rows = Histogram(
+    "list_response_rows", "Rows returned by list endpoints.",
+    ["resource"], buckets=(0, 1, 10, 50, 100, 250, 500, 1000, 5000, 10000)
+)
+list_cache_lookups = Counter("list_cache_lookups_total", "List cache lookups.", ["result"])
+
+
+class StatsCollector(Collector):
+    # Reads a component's stats() at scrape time instead of mirroring every change
+    # into a metric. With a label, stats() maps each label value to its stats.
+    def __init__(self, prefix: str, documentation: str, stats: Callable[[], Dict], gauges: Iterable[str] = (), counters: Iterable[str] = (), label: str = None):
+        self.prefix = prefix
+        self.documentation = documentation
+        self.stats = stats
+        self.gauges = tuple(gauges)
+        self.counters = tuple(counters)
+        self.label = label
+    
+    def collect(self):
+        labels = ([self.label] if self.label else []) + (["pid"] if MULTIPROCESS else [])
+        families = {
+            **{key: GaugeMetricFamily(f"{self.prefix}_{key}", f"{self.documentation} ({key})", labels=labels) for key in self.gauges},
+            **{key: CounterMetricFamily(f"{self.prefix}_{key}", f"{self.documentation} ({key})", labels=labels) for key in self.counters},
+        }
+        stats_by_label = self.stats() if self.label else {None: self.stats()}
+        for label_value, stats in stats_by_label.items():
+            # Collectors read this process's state; under multiprocess each worker
+            # reports only when it serves the scrape, so its series carry the pid.
+            values = ([label_value] if self.label else []) + ([str(os.getpid())] if MULTIPROCESS else [])
+            for key, family in families.items():
+                if key in stats:
+                    family.add_metric(values, stats[key])
+        return list(families.values())
+
+
+_stats_collectors: List[StatsCollector] = []
+
+
+def register_stats(prefix: str, documentation: str, stats: Callable[[], Dict], gauges: Iterable[str] = (), counters: Iterable[str] = (), label: str = None) -> None:
+    collector = StatsCollector(prefix, documentation, stats, gauges, counters, label)
+    _stats_collectors.append(collector)
+    if not MULTIPROCESS:
+        REGISTRY.register(collector)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float, statements: int, db_seconds: float) -> None:
+    http_requests.labels(method, route, status).inc()
+    http_request_duration.labels(method, route, status).observe(seconds)
+    if statements:
+        http_request_db_statements.labels(method, route).inc(statements)
+        http_request_db_seconds.labels(method, route).inc(db_seconds)
+
+
+def render_metrics() -> tuple:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        for collector in _stats_collectors:
+            registry.register(collector)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_exit() -> None:
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
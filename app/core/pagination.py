@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def seek(query, model, limit: int, cursor: Optional[str] = None, order_by: str = "created_at"):
+    column = getattr(model, order_by)
+    if cursor is not None:
+        value, id = decode_cursor(cursor)
+        # The redundant lower bound lets the planner seek into the (org, column, id)
+        # index; with bound parameters SQLite otherwise scans from the first row.
+        query = query.filter(
+            column >= value,
+            or_(
+                column > value,
+                and_(column == value, model.id > id)
+            )
+        )
+    
+    return query.order_by(column, model.id).limit(limit + 1)
+
+
+def page(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    
+    return rows, next_cursor
+
+
+def paginate(query: Query, model, limit: int, cursor: Optional[str] = None) -> Tuple[list, Optional[str]]:
+    return page(seek(query, model, limit, cursor).all(), limit)
@@ -1,20 +1,102 @@
+import asyncio
+import hashlib
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
-from jose import JWTError, jwt
+from typing import Awaitable, Callable, Optional, Tuple, Union
+from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
+from app.core import metrics
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# user_id -> users.token_version, re-read from the database once the TTL lapses so
+# a role change or removal on one worker reaches every other worker within the TTL
+_token_versions = TTLCache(maxsize=settings.token_cache_size)
+
+# sha256(token) -> decoded payload, kept until the token's own exp
+_token_cache = TTLCache(maxsize=settings.token_cache_size)
+
+_password_executor: Optional[ProcessPoolExecutor] = None
+_password_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+class PasswordHashingBusy(Exception):
+    pass
+
+
+def _timed_verify(plain_password: str, hashed_password: str) -> Tuple[bool, float]:
+    # Runs inside the hashing worker process; the caller records the duration so
+    # the sample lands in the serving worker's metrics.
+    started = time.perf_counter()
+    return pwd_context.verify(plain_password, hashed_password), time.perf_counter() - started
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    verified, elapsed = _timed_verify(plain_password, hashed_password)
+    metrics.password_verify_duration.observe(elapsed)
+    return verified
 
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _get_password_executor() -> ProcessPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        # The pool starts lazily from a threadpool thread; forking there could copy
+        # a lock another thread holds, so workers come from a clean server process.
+        _password_executor = ProcessPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _password_executor
+
+
+def _get_password_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _password_slots.get(loop)
+    if slots is None:
+        slots = _password_slots[loop] = asyncio.Semaphore(settings.password_hash_workers)
+    return slots
+
+
+async def _run_password_task(func, *args):
+    slots = _get_password_slots()
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=settings.password_hash_queue_timeout)
+    except asyncio.TimeoutError:
+        raise PasswordHashingBusy()
+    
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_password_executor(), func, *args)
+    finally:
+        slots.release()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    verified, elapsed = await _run_password_task(_timed_verify, plain_password, hashed_password)
+    metrics.password_verify_duration.observe(elapsed)
+    return verified
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_task(get_password_hash, password)
+
+
+def shutdown_password_executor() -> None:
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -28,8 +110,66 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def verify_token(token: str) -> Optional[dict]:
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(cache_key)
+    if payload is not None:
+        return dict(payload)
+    
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
+    except ExpiredSignatureError:
+        metrics.token_decode_failures.labels("expired").inc()
+        return None
     except JWTError:
+        metrics.token_decode_failures.labels("invalid").inc()
         return None
+    
+    if "exp" in payload:
+        _token_cache.set(cache_key, dict(payload), expires_at=payload["exp"])
+    return payload
+
+
+def token_cache_stats() -> dict:
+    return _token_cache.stats()
+
+
+metrics.register_stats(
+    "token_cache", "Decoded token and token version caches",
+    lambda: {"token": _token_cache.stats(), "token_version": _token_versions.stats()},
+    gauges=("size", "maxsize"), counters=("hits", "misses", "evictions"), label="cache"
+)
+
+
+def clear_token_cache() -> None:
+    _token_cache.clear()
+
+
+def current_token_version(user_id: int, load: Callable[[], Optional[int]]) -> Optional[int]:
+    version = _token_versions.get(user_id)
+    if version is None:
+        version = load()
+        if version is not None:
+            remember_token_version(user_id, version)
+    return version
+
+
+async def current_token_version_async(user_id: int, load: Callable[[], Awaitable[Optional[int]]]) -> Optional[int]:
+    version = _token_versions.get(user_id)
+    if version is None:
+        version = await load()
+        if version is not None:
+            remember_token_version(user_id, version)
+    return version
+
+
+def remember_token_version(user_id: int, version: int) -> None:
+    _token_versions.set(user_id, version, expires_at=time.time() + settings.token_version_cache_ttl)
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    # The caller has already bumped users.token_version; this only drops the local copy.
+    _token_versions.delete(user_id)
+
+
+def clear_token_version_cache() -> None:
+    _token_versions.clear()
@@ -0,0 +1,46 @@
+import json
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+from fastapi.responses import Response
+from app.core import metrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_encoder = json.JSONEncoder(default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return _encoder.encode(content).encode()
+
+
+def rows_to_dicts(keys: Iterable[str], rows: Iterable) -> List[dict]:
+    keys = list(keys)
+    return [dict(zip(keys, row)) for row in rows]
+
+
+class FastJSONResponse(Response):
+    # Returned as a Response, so FastAPI skips response_model validation while
+    # the route's declared response_model still drives the OpenAPI schema.
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def list_response(keys: Iterable[str], rows: Iterable, paginated: bool = False, next_cursor: Optional[str] = None, resource: Optional[str] = None) -> FastJSONResponse:
+    items = rows_to_dicts(keys, rows)
+    if resource is not None:
+        metrics.list_rows.labels(resource).observe(len(items))
+    return FastJSONResponse({"items": items, "next_cursor": next_cursor} if paginated else items)
@@ -0,0 +1,106 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core import metrics
+from app.core.config import settings
+
+logger = logging.getLogger("app.timing")
+
+
+class RequestStats:
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.sql: List[str] = []
+    
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements += 1
+        self.db_seconds += elapsed
+        if len(self.sql) < settings.slow_request_max_statements:
+            self.sql.append(statement)
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context._request_query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_request_query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def server_timing(elapsed: float, stats: RequestStats) -> str:
+    return f'app;dur={elapsed * 1000:.1f}, db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries"'
+
+
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp, slow_request_ms: float = 500.0, query_warning_threshold: int = 25):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.query_warning_threshold = query_warning_threshold
+        self._route_paths: Optional[dict] = None
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", server_timing(time.perf_counter() - started, stats))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            elapsed = time.perf_counter() - started
+            route = self._route_template(scope)
+            metrics.observe_request(scope["method"], route, status_code, elapsed, stats.statements, stats.db_seconds)
+            self._log(scope, route, status_code, elapsed, stats)
+    
+    def _route_template(self, scope: Scope) -> str:
+        # The router records the matched endpoint in the scope; labelling by the path
+        # template keeps one series per route instead of one per note id.
+        if self._route_paths is None:
+            self._route_paths = {route.endpoint: route.path for route in scope["app"].routes if hasattr(route, "endpoint")}
+        return self._route_paths.get(scope.get("endpoint"), "unmatched")
+    
+    def _log(self, scope: Scope, route: str, status_code: int, elapsed: float, stats: RequestStats) -> None:
+        slow = elapsed * 1000 >= self.slow_request_ms
+        chatty = stats.statements >= self.query_warning_threshold
+        if not slow and not chatty:
+            return
+        
+        logger.warning(
+            "%s %s (%s) -> %s took %.1f ms with %d SQL statements (%.1f ms in the database)%s%s",
+            scope["method"], scope["path"], route, status_code, elapsed * 1000,
+            stats.statements, stats.db_seconds * 1000,
+            "" if slow else "; query count exceeds the warning threshold",
+            "".join(f"\n  {statement}" for statement in stats.sql),
+        )
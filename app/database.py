@@ -1,22 +1,127 @@
+import time
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from app.core import metrics
+
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class _TimedCheckoutMixin:
+    metrics_label = "sync"
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.db_pool_checkout_timeouts.labels(self.metrics_label).inc()
+            metrics.db_pool_checkout_wait.labels(self.metrics_label).observe(time.perf_counter() - started)
+            raise
+        metrics.db_pool_checkouts.labels(self.metrics_label).inc()
+        metrics.db_pool_checkout_wait.labels(self.metrics_label).observe(time.perf_counter() - started)
+        self._update_gauges()
+        return connection
+    
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._update_gauges()
+    
+    def _update_gauges(self) -> None:
+        metrics.db_pool_checked_out.labels(self.metrics_label).set(self.checkedout())
+        metrics.db_pool_overflow.labels(self.metrics_label).set(max(self.overflow(), 0))
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def _engine_options(url: str, poolclass) -> dict:
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+    
+    options.update(
+        poolclass=poolclass,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    return options
+
+
+engine = create_engine(settings.database_url, **_engine_options(settings.database_url, InstrumentedQueuePool))
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
 
+def get_async_database_url() -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    
+    scheme, rest = settings.database_url.split("://", 1)
+    dialect = scheme.split("+", 1)[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{dialect}' databases")
+    return f"{ASYNC_DRIVERS[dialect]}://{rest}"
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.async_database:
+    async_database_url = get_async_database_url()
+    async_engine = create_async_engine(
+        async_database_url,
+        **_engine_options(async_database_url, InstrumentedAsyncQueuePool)
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def pool_stats() -> dict:
+    pools = {"sync": engine.pool}
+    if async_engine is not None:
+        pools["async"] = async_engine.sync_engine.pool
+    return {
+        label: {"size": pool.size(), "checked_in": pool.checkedin(), "max_overflow": settings.db_max_overflow}
+        for label, pool in pools.items()
+        if isinstance(pool, QueuePool)
+    }
+
+
+metrics.register_stats(
+    "db_pool", "Connection pool configuration and idle connections",
+    pool_stats, gauges=("size", "checked_in", "max_overflow"), label="pool"
+)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
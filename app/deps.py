@@ -1,10 +1,13 @@
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.core.security import verify_token
+from app.database import SessionLocal, get_db, get_async_db
+from app.core.security import verify_token, current_token_version, current_token_version_async
 from app.models.user import User, UserRole
-from app.schemas.user import TokenData
+from app.schemas.user import TokenData, Principal
 
 security = HTTPBearer()
 
@@ -32,7 +35,7 @@ def get_current_user(
         raise credentials_exception
     
     user = db.query(User).filter(User.id == token_data.user_id).first()
-    if user is None:
+    if user is None or payload.get("token_version", 0) != user.token_version:
         raise credentials_exception
     
     return user
@@ -59,9 +62,104 @@ def get_current_user_token_data(
     except Exception:
         raise credentials_exception
     
+    token_data.token_version = payload.get("token_version", 0)
     return token_data
 
 
+async def get_current_user_async(
+    token_data: TokenData = Depends(get_current_user_token_data),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    result = await db.execute(select(User).where(User.id == token_data.user_id))
+    user = result.scalar_one_or_none()
+    if user is None or token_data.token_version != user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return user
+
+
+def _decode_principal_token(credentials: HTTPAuthorizationCredentials) -> Tuple[TokenData, dict]:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        payload = verify_token(credentials.credentials)
+        if payload is None:
+            raise credentials_exception
+        
+        token_data = TokenData(**payload)
+        if (
+            token_data.user_id is None
+            or token_data.organization_id is None
+            or token_data.role is None
+        ):
+            raise credentials_exception
+            
+    except Exception:
+        raise credentials_exception
+    
+    return token_data, payload
+
+
+def _principal(token_data: TokenData, payload: dict, version: Optional[int]) -> Principal:
+    if version is None or payload.get("token_version", 0) != version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return Principal(
+        id=token_data.user_id,
+        username=token_data.username,
+        organization_id=token_data.organization_id,
+        role=token_data.role
+    )
+
+
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    token_data, payload = _decode_principal_token(credentials)
+    version = current_token_version(
+        token_data.user_id,
+        lambda: db.scalar(select(User.token_version).where(User.id == token_data.user_id))
+    )
+    return _principal(token_data, payload, version)
+
+
+async def get_current_principal_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    token_data, payload = _decode_principal_token(credentials)
+    version = await current_token_version_async(
+        token_data.user_id,
+        lambda: db.scalar(select(User.token_version).where(User.id == token_data.user_id))
+    )
+    return _principal(token_data, payload, version)
+
+
+def get_stream_principal(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Principal:
+    # A get_db session would stay checked out until a long-lived stream ends,
+    # so the version lookup borrows a connection only for its own query.
+    token_data, payload = _decode_principal_token(credentials)
+    
+    def load_version() -> Optional[int]:
+        with SessionLocal() as db:
+            return db.scalar(select(User.token_version).where(User.id == token_data.user_id))
+    
+    return _principal(token_data, payload, current_token_version(token_data.user_id, load_version))
+
+
 def require_admin_role(current_user: User = Depends(get_current_user)) -> User:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
@@ -71,6 +169,15 @@ def require_admin_role(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+async def require_admin_role_async(current_user: User = Depends(get_current_user_async)) -> User:
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. ADMIN role required."
+        )
+    return current_user
+
+
 def require_same_organization(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1,15 +1,37 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api import auth, organizations, notes, todos
-from app.database import engine
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import mark_worker_exit, render_metrics
+from app.core.timing import TimingMiddleware
+from app.core.security import PasswordHashingBusy, shutdown_password_executor
+from app.database import engine, async_engine
+from app.api import bulk, events, export, health, imports, search, sync
 from app.models import base
 
+if settings.async_database:
+    from app.api.aio import auth, organizations, notes, todos
+else:
+    from app.api import auth, organizations, notes, todos
+
 base.Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_password_executor()
+    mark_worker_exit()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 app = FastAPI(
     title=settings.project_name,
-    openapi_url=f"{settings.api_v1_str}/openapi.json"
+    openapi_url=f"{settings.api_v1_str}/openapi.json",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -20,7 +42,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+
+app.add_middleware(
+    TimingMiddleware,
+    slow_request_ms=settings.slow_request_ms,
+    query_warning_threshold=settings.request_query_warning_threshold,
+)
+
+
+@app.exception_handler(PasswordHashingBusy)
+def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+app.include_router(health.router)
 app.include_router(auth.router, prefix=settings.api_v1_str)
+app.include_router(bulk.router, prefix=settings.api_v1_str)
+app.include_router(export.router, prefix=settings.api_v1_str)
+app.include_router(imports.router, prefix=settings.api_v1_str)
+app.include_router(search.router, prefix=settings.api_v1_str)
+app.include_router(sync.router, prefix=settings.api_v1_str)
+app.include_router(events.router, prefix=settings.api_v1_str)
 app.include_router(organizations.router, prefix=settings.api_v1_str)
 app.include_router(notes.router, prefix=settings.api_v1_str)
 app.include_router(todos.router, prefix=settings.api_v1_str)
@@ -39,3 +91,10 @@ def read_root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.base import Base
+from app.models.organization import Organization
+
+
+class Change(Base):
+    __tablename__ = "changes"
+    
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<Change(id={self.id}, organization_id={self.organization_id})>"
+
+
+def _lock_organization(organization_id: int):
+    return select(Organization.id).where(Organization.id == organization_id).with_for_update()
+
+
+def record_change(db: Session, organization_id: int) -> int:
+    # Every write to a synced table stamps its rows with a change id drawn here.
+    # The organization's row lock is held until commit, so one organization's
+    # change ids become visible in order and /sync can page by them without
+    # stepping over a write that has not committed yet.
+    db.execute(_lock_organization(organization_id))
+    return db.execute(insert(Change).values(organization_id=organization_id)).inserted_primary_key[0]
+
+
+async def record_change_async(db: AsyncSession, organization_id: int) -> int:
+    await db.execute(_lock_organization(organization_id))
+    return (await db.execute(insert(Change).values(organization_id=organization_id))).inserted_primary_key[0]
@@ -1,14 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 
 
 class Note(Base, TimestampMixin):
     __tablename__ = "notes"
+    __table_args__ = (
+        Index("ix_notes_org_created_at_id", "organization_id", "created_at", "id"),
+        Index("ix_notes_org_created_by_created_at", "organization_id", "created_by", "created_at"),
+        Index("ix_notes_org_change_id_id", "organization_id", "change_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+    change_id = Column(Integer, server_default="0", nullable=False)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
@@ -17,3 +24,39 @@ class Note(Base, TimestampMixin):
     
     def __repr__(self):
         return f"<Note(id={self.id}, title='{self.title}')>"
+
+
+# Full-text index over title/content: FULLTEXT on MySQL, an FTS5 table kept in
+# sync by triggers on SQLite, so every write path is indexed by the database.
+NOTES_FTS_TABLE = "notes_fts"
+
+MYSQL_FULLTEXT_DDL = [
+    "ALTER TABLE notes ADD FULLTEXT INDEX ft_notes_title_content (title, content)",
+]
+
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {NOTES_FTS_TABLE} "
+    "USING fts5(title, content, content='notes', content_rowid='id')",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO {NOTES_FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO {NOTES_FTS_TABLE}({NOTES_FTS_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE OF title, content ON notes BEGIN
+        INSERT INTO {NOTES_FTS_TABLE}({NOTES_FTS_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {NOTES_FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+for statement in MYSQL_FULLTEXT_DDL:
+    event.listen(Note.__table__, "after_create", DDL(statement).execute_if(dialect="mysql"))
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(Note.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    Note.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {NOTES_FTS_TABLE}").execute_if(dialect="sqlite")
+)
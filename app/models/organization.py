@@ -1,17 +1,61 @@
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, event, insert, delete, inspect
+from sqlalchemy.orm import relationship, validates
 from app.models.base import Base, TimestampMixin
 
 
+def name_trigrams(name: str) -> set:
+    normalized = name.lower()
+    return {normalized[index:index + 3] for index in range(len(normalized) - 2)}
+
+
 class Organization(Base, TimestampMixin):
     __tablename__ = "organizations"
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), unique=True, nullable=False)
+    search_name = Column(String(100), nullable=False, index=True)
     
     users = relationship("User", back_populates="organization")
     notes = relationship("Note", back_populates="organization")
     todos = relationship("Todo", back_populates="organization")
     
+    @validates("name")
+    def _set_search_name(self, key, name):
+        self.search_name = name.lower()
+        return name
+    
     def __repr__(self):
         return f"<Organization(id={self.id}, name='{self.name}')>"
+
+
+class OrganizationTrigram(Base):
+    __tablename__ = "organization_trigrams"
+    __table_args__ = (
+        Index("ix_organization_trigrams_organization_id", "organization_id"),
+    )
+    
+    trigram = Column(String(3), primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+
+
+def _insert_trigrams(connection, organization) -> None:
+    rows = [
+        {"trigram": trigram, "organization_id": organization.id}
+        for trigram in name_trigrams(organization.name)
+    ]
+    if rows:
+        connection.execute(insert(OrganizationTrigram.__table__), rows)
+
+
+@event.listens_for(Organization, "after_insert")
+def _index_new_organization(mapper, connection, organization):
+    _insert_trigrams(connection, organization)
+
+
+@event.listens_for(Organization, "after_update")
+def _reindex_renamed_organization(mapper, connection, organization):
+    if not inspect(organization).attrs.name.history.has_changes():
+        return
+    trigrams = OrganizationTrigram.__table__
+    connection.execute(delete(trigrams).where(trigrams.c.organization_id == organization.id))
+    _insert_trigrams(connection, organization)
@@ -1,14 +1,22 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 
 
 class Todo(Base, TimestampMixin):
     __tablename__ = "todos"
+    __table_args__ = (
+        Index("ix_todos_org_created_at_id", "organization_id", "created_at", "id"),
+        Index("ix_todos_org_created_by_created_at", "organization_id", "created_by", "created_at"),
+        Index("ix_todos_org_change_id_id", "organization_id", "change_id", "id"),
+        Index("ix_todos_org_completed", "organization_id", "completed"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     completed = Column(Boolean, default=False, nullable=False)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+    change_id = Column(Integer, server_default="0", nullable=False)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Iterable
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, insert
+from app.models.base import Base
+
+
+class Tombstone(Base):
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_org_change_id_id", "organization_id", "change_id", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    resource_type = Column(String(20), nullable=False)
+    resource_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    change_id = Column(Integer, server_default="0", nullable=False)
+    
+    def __repr__(self):
+        return f"<Tombstone(resource_type='{self.resource_type}', resource_id={self.resource_id})>"
+
+
+def tombstones_for(model, organization_id: int, ids: Iterable[int], change_id: int):
+    # Hard deletes leave a tombstone so /sync can report them to offline clients.
+    deleted_at = datetime.utcnow()
+    return insert(Tombstone).values([
+        {
+            "organization_id": organization_id,
+            "resource_type": model.__tablename__,
+            "resource_id": id,
+            "deleted_at": deleted_at,
+            "change_id": change_id
+        }
+        for id in ids
+    ])
+
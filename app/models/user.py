@@ -17,6 +17,7 @@ class User(Base, TimestampMixin):
     password_hash = Column(String(255), nullable=False)
     role = Column(Enum(UserRole), default=UserRole.MEMBER, nullable=False)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     
     organization = relationship("Organization", back_populates="users")
     notes = relationship("Note", back_populates="created_by_user")
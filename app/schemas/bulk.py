@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class BulkDelete(BaseModel):
+    ids: List[int]
+
+
+class BulkItemResult(BaseModel):
+    id: int
+    status: str
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportSummary(BaseModel):
+    imported: int
+    rejected: int
+    errors: List[ImportRowError]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -17,12 +17,17 @@ class NoteUpdate(BaseModel):
     content: Optional[str] = None
 
 
+class NoteBulkUpdate(NoteUpdate):
+    id: int
+
+
 class NoteResponse(NoteBase):
     id: int
     organization_id: int
     created_by: int
     created_at: datetime
     updated_at: datetime
+    version: int
     
     class Config:
         from_attributes = True
@@ -30,3 +35,8 @@ class NoteResponse(NoteBase):
 
 class NoteWithUser(NoteResponse):
     created_by_username: str
+
+
+class NotePage(BaseModel):
+    items: List[NoteWithUser]
+    next_cursor: Optional[str] = None
@@ -26,3 +26,13 @@ class OrganizationResponse(OrganizationBase):
 
 class OrganizationWithUsers(OrganizationResponse):
     users: List[UserResponse]
+
+
+class OrganizationSummary(OrganizationBase):
+    id: int
+    created_at: datetime
+
+
+class OrganizationPage(BaseModel):
+    items: List[OrganizationSummary]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+from app.schemas.note import NoteWithUser
+from app.schemas.todo import TodoWithUser
+
+
+class DeletedRecord(BaseModel):
+    resource_type: str
+    id: int
+    deleted_at: datetime
+
+
+class SyncResponse(BaseModel):
+    notes: List[NoteWithUser]
+    todos: List[TodoWithUser]
+    deleted: List[DeletedRecord]
+    next_token: str
+    has_more: bool
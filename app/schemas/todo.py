@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -17,12 +17,17 @@ class TodoUpdate(BaseModel):
     completed: Optional[bool] = None
 
 
+class TodoBulkUpdate(TodoUpdate):
+    id: int
+
+
 class TodoResponse(TodoBase):
     id: int
     organization_id: int
     created_by: int
     created_at: datetime
     updated_at: datetime
+    version: int
     
     class Config:
         from_attributes = True
@@ -30,3 +35,8 @@ class TodoResponse(TodoBase):
 
 class TodoWithUser(TodoResponse):
     created_by_username: str
+
+
+class TodoPage(BaseModel):
+    items: List[TodoWithUser]
+    next_cursor: Optional[str] = None
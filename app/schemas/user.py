@@ -54,3 +54,11 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
     organization_id: Optional[int] = None
     role: Optional[UserRole] = None
+    token_version: int = 0
+
+
+class Principal(BaseModel):
+    id: int
+    username: Optional[str] = None
+    organization_id: int
+    role: UserRole
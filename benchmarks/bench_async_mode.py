@@ -0,0 +1,103 @@
+"""Compare throughput of the sync and async database modes under concurrent reads.
+
+Run from the repository root:
+
+    python benchmarks/bench_async_mode.py --requests 2000 --concurrency 32
+    python benchmarks/bench_async_mode.py --database-url "mysql+mysqlconnector://..."
+
+Each mode runs in its own subprocess (settings are read at import time) and
+serves GET /notes/ through httpx's ASGI transport. The script prints
+requests/second and p50/p99 latency for both. Sync mode is capped by the
+threadpool; the gap widens as database round-trip latency grows. Keep sync
+concurrency below the threadpool size (40): beyond that, threads blocked on a
+pool checkout can starve the session teardowns that would free a connection.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PREFIX = "/api/v1"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_worker(args):
+    sys.path.insert(0, ROOT)
+    import httpx
+    from app.main import app
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        username = f"bench_{os.getpid()}"
+        await client.post(
+            f"{PREFIX}/auth/signup",
+            json={"username": username, "password": "benchpass", "organization_name": username}
+        )
+        login = await client.post(f"{PREFIX}/auth/login", json={"username": username, "password": "benchpass"})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        for index in range(args.notes):
+            await client.post(f"{PREFIX}/notes/", json={"title": f"Note {index}", "content": "x" * 200}, headers=headers)
+        
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies = []
+        
+        async def _read():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(f"{PREFIX}/notes/", headers=headers)
+                latencies.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(_read() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+    
+    print(json.dumps({
+        "rps": args.requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+    }))
+
+
+def run_mode(mode, args):
+    env = dict(os.environ)
+    env["database_url"] = args.database_url
+    env["async_database"] = "true" if mode == "async" else "false"
+    command = [
+        sys.executable, __file__, "--worker",
+        "--requests", str(args.requests),
+        "--concurrency", str(args.concurrency),
+        "--notes", str(args.notes),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    for mode in ("sync", "async"):
+        result = run_mode(mode, args)
+        print(f"{mode:>6}: {result['rps']:8.1f} req/s  p50={result['p50']:7.2f}ms  p99={result['p99']:7.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=f"sqlite:///{tempfile.gettempdir()}/bench_async_mode.db")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--notes", type=int, default=50)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        asyncio.run(run_worker(args))
+    else:
+        main(args)
@@ -0,0 +1,78 @@
+"""Benchmark response compression for note list payloads.
+
+Run from the repository root:
+
+    python benchmarks/bench_compression.py --rows 10 100 1000
+
+For each list size, reports the uncompressed body size, the bytes sent on the
+wire and the CPU time per request that CompressionMiddleware adds at several
+gzip levels (and brotli qualities when the brotli package is installed).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("database_url", f"sqlite:///{tempfile.gettempdir()}/bench_compression_app.db")
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware
+from app.core.serialization import dumps, rows_to_dicts
+from bench_list_serialization import KEYS, make_rows
+
+
+def payload(count: int) -> bytes:
+    return dumps(rows_to_dicts(KEYS, make_rows(count)))
+
+
+def serve(body: bytes, encoding: str, **options) -> int:
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+    
+    sent = []
+    
+    async def send(message):
+        if message["type"] == "http.response.body":
+            sent.append(len(message["body"]))
+    
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", encoding.encode())]}
+    asyncio.run(CompressionMiddleware(endpoint, **options)(scope, None, send))
+    return sum(sent)
+
+
+def timed(body: bytes, encoding: str, repeat: int, **options) -> tuple:
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        size = serve(body, encoding, **options)
+        samples.append(time.process_time() - started)
+    return size, statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    
+    configurations = [("identity", "identity", {})]
+    configurations += [(f"gzip level {level}", "gzip", {"gzip_level": level}) for level in (1, 6, 9)]
+    if compression.brotli is not None:
+        configurations += [(f"br quality {quality}", "br", {"brotli_quality": quality}) for quality in (1, 4, 11)]
+    
+    for rows in args.rows:
+        body = payload(rows)
+        _, baseline = timed(body, "identity", args.repeat)
+        print(f"rows: {rows}  ({len(body)} bytes uncompressed)")
+        for label, encoding, options in configurations:
+            size, elapsed = timed(body, encoding, args.repeat, minimum_size=0, **options)
+            print(f"  {label:<16}{size:>10} bytes  {size / len(body):6.1%}  {(elapsed - baseline) * 1000:7.3f} ms cpu")
+
+
+if __name__ == "__main__":
+    main()
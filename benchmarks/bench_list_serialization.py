@@ -0,0 +1,89 @@
+"""Benchmark serialization of note list responses.
+
+Run from the repository root:
+
+    python benchmarks/bench_list_serialization.py --rows 10000
+
+Compares the old path, where FastAPI validates hand-built dicts against
+List[NoteWithUser] and then runs jsonable_encoder and json.dumps, with the
+fast path the list endpoints now use: plain rows encoded straight to bytes.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("database_url", f"sqlite:///{tempfile.gettempdir()}/bench_list_serialization_app.db")
+
+from datetime import datetime, timedelta
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.core import serialization
+from app.core.serialization import FastJSONResponse, rows_to_dicts
+from app.schemas.note import NoteWithUser
+
+KEYS = [
+    "title", "content", "id", "organization_id", "created_by",
+    "created_at", "updated_at", "version", "created_by_username",
+]
+
+
+def make_rows(count: int) -> List[tuple]:
+    base = datetime(2024, 1, 1)
+    return [
+        (
+            f"Note {index}", "Some note content " * 8, index, 1, index % 50,
+            base + timedelta(seconds=index), base + timedelta(seconds=index, microseconds=index), 1,
+            f"user{index % 50}",
+        )
+        for index in range(count)
+    ]
+
+
+def validated_response(rows: List[tuple]) -> bytes:
+    field = create_response_field(name="Response_get_notes", type_=List[NoteWithUser])
+    content = asyncio.run(serialize_response(field=field, response_content=rows_to_dicts(KEYS, rows), is_coroutine=True))
+    return JSONResponse(content).body
+
+
+def fast_response(rows: List[tuple]) -> bytes:
+    return FastJSONResponse(rows_to_dicts(KEYS, rows)).body
+
+
+def timed(fn, rows: List[tuple], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    
+    rows = make_rows(args.rows)
+    backend = "orjson" if serialization.orjson is not None else "json"
+    
+    before = timed(validated_response, rows, args.repeat)
+    after = timed(fast_response, rows, args.repeat)
+    serialization.orjson = None
+    after_stdlib = timed(fast_response, rows, args.repeat)
+    
+    print(f"rows: {args.rows}")
+    print(f"{'response_model validation':<28}{before * 1000:8.1f} ms")
+    print(f"{f'fast path ({backend})':<28}{after * 1000:8.1f} ms  ({before / after:.1f}x)")
+    print(f"{'fast path (json fallback)':<28}{after_stdlib * 1000:8.1f} ms  ({before / after_stdlib:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark organization typeahead search against a large organizations table.
+
+Run from the repository root:
+
+    python benchmarks/bench_org_search.py --organizations 1000000
+
+Builds a scratch SQLite database with synthetic organization names and their
+trigram postings, then times the indexed prefix and trigram infix queries
+used by /organizations/search against the old leading-wildcard ILIKE scan.
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("database_url", f"sqlite:///{tempfile.gettempdir()}/bench_org_search_app.db")
+
+from datetime import datetime
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from app.api.organizations import (
+    _infix_search_query,
+    _normalize_search_term,
+    _prefix_search_query,
+    _rank_infix_matches,
+    _rarest_trigram,
+    _trigram_counts_query,
+)
+from app.models import note, todo, user
+from app.models.base import Base
+from app.models.organization import Organization, OrganizationTrigram, name_trigrams
+
+WORDS = [
+    "acme", "global", "labs", "systems", "north", "river", "digital", "partners", "cloud", "works",
+    "studio", "health", "capital", "foods", "logistics", "energy", "media", "ventures", "data", "group",
+]
+
+
+def organization_name(index: int) -> str:
+    rng = random.Random(index)
+    words = rng.sample(WORDS, 2)
+    suffix = "".join(rng.choices(string.ascii_lowercase, k=4))
+    return f"{words[0].title()} {words[1].title()} {suffix}{index}"
+
+
+def populate(engine, count: int, batch_size: int = 20000) -> None:
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        for start in range(0, count, batch_size):
+            organizations, trigrams = [], []
+            for index in range(start, min(start + batch_size, count)):
+                name = organization_name(index)
+                organizations.append({
+                    "id": index + 1, "name": name, "search_name": name.lower(),
+                    "created_at": now, "updated_at": now,
+                })
+                trigrams.extend({"trigram": gram, "organization_id": index + 1} for gram in name_trigrams(name))
+            connection.execute(insert(Organization.__table__), organizations)
+            connection.execute(insert(OrganizationTrigram.__table__), trigrams)
+
+
+def infix_search(session, term: str, limit: int = 10) -> list:
+    # The same two steps as the endpoint: pick the rarest trigram, then walk it.
+    trigrams = sorted(name_trigrams(term))
+    driver_trigram = _rarest_trigram(trigrams, session.execute(_trigram_counts_query(trigrams)).one())
+    if driver_trigram is None:
+        return []
+    return _rank_infix_matches(session.scalars(_infix_search_query(term, driver_trigram, limit, [])).all(), limit)
+
+
+def time_query(session, run, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(session)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main(args):
+    path = os.path.join(tempfile.gettempdir(), f"bench_org_search_{args.organizations}.db")
+    engine = create_engine(f"sqlite:///{path}")
+    if not os.path.exists(path):
+        Base.metadata.create_all(engine)
+        started = time.perf_counter()
+        populate(engine, args.organizations)
+        print(f"populated {args.organizations} organizations in {time.perf_counter() - started:.1f}s ({path})")
+    
+    def statement(build):
+        return lambda session: session.scalars(build()).all()
+    
+    queries = {
+        "prefix 'a'": statement(lambda: _prefix_search_query("a", 10)),
+        "prefix 'acme gl'": statement(lambda: _prefix_search_query("acme gl", 10)),
+        "infix 'ystem'": lambda session: infix_search(session, "ystem"),
+        "infix 'tems nor'": lambda session: infix_search(session, _normalize_search_term("tems nor")),
+        "infix 'bcd12'": lambda session: infix_search(session, "bcd12"),
+        "infix 'ystemsx' (no match)": lambda session: infix_search(session, "ystemsx"),
+        "ilike '%tems nor%' (old)": statement(lambda: select(Organization).where(Organization.name.ilike("%tems nor%"))),
+    }
+    
+    with Session(engine) as session:
+        for label, run in queries.items():
+            samples = time_query(session, run, args.repeat)
+            print(f"{label:>28}: median={statistics.median(samples):8.2f}ms max={max(samples):8.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--organizations", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
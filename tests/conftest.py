@@ -0,0 +1,91 @@
+import os
+import uuid
+from contextlib import contextmanager
+
+os.environ.setdefault("database_url", "sqlite:///./test.db")
+
+if os.path.exists("./test.db"):
+    os.remove("./test.db")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.database import get_db
+from app.models.base import Base
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+Base.metadata.create_all(bind=engine)
+
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+@pytest.fixture
+def db():
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def unique_name(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:10]}"
+
+
+@pytest.fixture
+def signup_and_login(client):
+    def _signup_and_login(organization_name: str = None, username: str = None) -> dict:
+        username = username or unique_name("user")
+        organization_name = organization_name or unique_name("org")
+        client.post(
+            "/api/v1/auth/signup",
+            json={"username": username, "password": "testpass", "organization_name": organization_name}
+        )
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "testpass"}
+        )
+        token = response.json()["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+    
+    return _signup_and_login
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(bind=engine):
+    counter = QueryCounter()
+    
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+    
+    event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(bind, "before_cursor_execute", _before_cursor_execute)
@@ -0,0 +1,143 @@
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.api.aio import auth, organizations, notes, todos
+from app.core.security import clear_token_version_cache
+from app.database import get_async_db, get_db
+from tests.conftest import unique_name
+
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+
+@pytest.fixture
+def async_client():
+    app = FastAPI()
+    for module in (auth, organizations, notes, todos):
+        app.include_router(module.router, prefix="/api/v1")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return TestClient(app)
+
+
+def signup_and_login(client, organization_name: str = None) -> dict:
+    username = unique_name("user")
+    client.post(
+        "/api/v1/auth/signup",
+        json={"username": username, "password": "testpass", "organization_name": organization_name or unique_name("org")}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": username, "password": "testpass"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+class TestAsyncHandlers:
+    def test_note_crud(self, async_client):
+        headers = signup_and_login(async_client)
+        
+        created = async_client.post(
+            "/api/v1/notes/",
+            json={"title": "Async", "content": "content"},
+            headers=headers
+        )
+        assert created.status_code == 200
+        note_id = created.json()["id"]
+        
+        listed = async_client.get("/api/v1/notes/", headers=headers).json()
+        assert [note["id"] for note in listed] == [note_id]
+        assert listed[0]["created_by_username"]
+        
+        updated = async_client.put(f"/api/v1/notes/{note_id}", json={"title": "Renamed"}, headers=headers)
+        assert updated.json()["title"] == "Renamed"
+        
+        assert async_client.delete(f"/api/v1/notes/{note_id}", headers=headers).status_code == 200
+        assert async_client.get(f"/api/v1/notes/{note_id}", headers=headers).status_code == 404
+    
+    def test_todo_pagination(self, async_client):
+        headers = signup_and_login(async_client)
+        for index in range(3):
+            async_client.post("/api/v1/todos/", json={"title": f"Todo {index}"}, headers=headers)
+        
+        first = async_client.get("/api/v1/todos/", params={"limit": 2}, headers=headers).json()
+        second = async_client.get(
+            "/api/v1/todos/",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+            headers=headers
+        ).json()
+        
+        titles = [todo["title"] for todo in first["items"] + second["items"]]
+        assert titles == ["Todo 0", "Todo 1", "Todo 2"]
+        assert second["next_cursor"] is None
+    
+    def test_member_joins_existing_organization(self, async_client):
+        organization_name = unique_name("org")
+        admin_headers = signup_and_login(async_client, organization_name)
+        signup_and_login(async_client, organization_name)
+        
+        organization = async_client.get("/api/v1/organizations/me", headers=admin_headers).json()
+        users = async_client.get(
+            f"/api/v1/organizations/{organization['id']}/users",
+            headers=admin_headers
+        ).json()
+        assert sorted(user["role"] for user in users) == ["ADMIN", "MEMBER"]
+    
+    def test_public_organizations_revalidate(self, async_client):
+        signup_and_login(async_client)
+        etag = async_client.get("/api/v1/organizations/public").headers["etag"]
+        
+        response = async_client.get("/api/v1/organizations/public", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        organization_name = unique_name("org")
+        signup_and_login(async_client, organization_name)
+        response = async_client.get("/api/v1/organizations/public", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert organization_name in [org["name"] for org in response.json()]
+    
+    def test_note_etags(self, async_client):
+        headers = signup_and_login(async_client)
+        created = async_client.post("/api/v1/notes/", json={"title": "Async", "content": "content"}, headers=headers)
+        note_id = created.json()["id"]
+        etag = created.headers["etag"]
+        
+        response = async_client.get(f"/api/v1/notes/{note_id}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        
+        response = async_client.put(f"/api/v1/notes/{note_id}", json={"title": "New"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 200
+        response = async_client.put(f"/api/v1/notes/{note_id}", json={"title": "Lost"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+        response = async_client.delete(f"/api/v1/notes/{note_id}", headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+    
+    def test_todo_fields(self, async_client):
+        headers = signup_and_login(async_client)
+        todo_id = async_client.post("/api/v1/todos/", json={"title": "Sparse"}, headers=headers).json()["id"]
+        
+        listed = async_client.get("/api/v1/todos/", params={"fields": "id,completed"}, headers=headers).json()
+        assert listed == [{"id": todo_id, "completed": False}]
+        detail = async_client.get(f"/api/v1/todos/{todo_id}", params={"fields": "title"}, headers=headers).json()
+        assert detail == {"title": "Sparse"}
+    
+    def test_reads_do_not_open_a_sync_session(self, async_client):
+        headers = signup_and_login(async_client)
+        clear_token_version_cache()
+        
+        def sync_db_unavailable():
+            raise AssertionError("async handlers must not check out a sync connection")
+            yield
+        
+        async_client.app.dependency_overrides[get_db] = sync_db_unavailable
+        for path in ("/api/v1/notes/", "/api/v1/todos/", "/api/v1/organizations/me"):
+            assert async_client.get(path, headers=headers).status_code == 200
@@ -5,6 +5,7 @@ from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.database import get_db
 from app.models.base import Base
+from tests.conftest import count_queries, unique_name
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
@@ -72,3 +73,17 @@ class TestAuth:
         )
         assert response.status_code == 401
         assert "Incorrect username or password" in response.json()["detail"]
+
+
+class TestAuthWrites:
+    def test_signup_does_not_read_back(self, client):
+        with count_queries() as counter:
+            response = client.post(
+                "/api/v1/auth/signup",
+                json={"username": unique_name("user"), "password": "testpass", "organization_name": unique_name("org")}
+            )
+        
+        assert response.status_code == 200
+        assert response.json()["id"]
+        assert counter.count == 5
+        assert counter.statements[-1].startswith("INSERT")
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from app.api.bulk import _insert_consecutive
+from app.models.todo import Todo
+from app.models.user import User
+from tests.conftest import count_queries
+
+
+class TestBulk:
+    def test_bulk_create_todos_in_one_transaction(self, client, signup_and_login):
+        headers = signup_and_login()
+        items = [{"title": f"Todo {index}"} for index in range(20)]
+        
+        with count_queries() as counter:
+            response = client.post("/api/v1/todos/bulk", json=items, headers=headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [todo["title"] for todo in data] == [item["title"] for item in items]
+        assert all(todo["id"] for todo in data)
+        inserts = [statement for statement in counter.statements if statement.startswith("INSERT INTO todos")]
+        assert len(inserts) == 1
+    
+    def test_bulk_update_reports_foreign_ids_as_not_found(self, client, signup_and_login):
+        headers = signup_and_login()
+        other_headers = signup_and_login()
+        own = client.post("/api/v1/notes/bulk", json=[{"title": "Mine", "content": "a"}], headers=headers).json()
+        foreign = client.post("/api/v1/notes/bulk", json=[{"title": "Theirs", "content": "b"}], headers=other_headers).json()
+        
+        response = client.patch(
+            "/api/v1/notes/bulk",
+            json=[{"id": own[0]["id"], "title": "Renamed"}, {"id": foreign[0]["id"], "title": "Hijacked"}],
+            headers=headers
+        )
+        
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()] == ["updated", "not_found"]
+        own_note = client.get(f"/api/v1/notes/{own[0]['id']}", headers=headers).json()
+        assert own_note["title"] == "Renamed"
+        assert own_note["version"] == own[0]["version"] + 1
+        foreign_note = client.get(f"/api/v1/notes/{foreign[0]['id']}", headers=other_headers).json()
+        assert foreign_note["title"] == "Theirs"
+        assert foreign_note["version"] == foreign[0]["version"]
+    
+    def test_bulk_delete_todos(self, client, signup_and_login):
+        headers = signup_and_login()
+        created = client.post("/api/v1/todos/bulk", json=[{"title": "a"}, {"title": "b"}], headers=headers).json()
+        ids = [todo["id"] for todo in created]
+        
+        response = client.request("DELETE", "/api/v1/todos/bulk", json={"ids": ids + [0]}, headers=headers)
+        
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()] == ["deleted", "deleted", "not_found"]
+        assert client.get("/api/v1/todos/", headers=headers).json() == []
+    
+    def test_bulk_rejects_oversized_batches(self, client, signup_and_login, monkeypatch):
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "bulk_max_items", 2)
+        headers = signup_and_login()
+        
+        response = client.post("/api/v1/todos/bulk", json=[{"title": "x"}] * 3, headers=headers)
+        assert response.status_code == 400
+    
+    def test_insert_consecutive_fails_when_ids_are_not_the_batch(self, client, signup_and_login, db):
+        signup_and_login(username="consecutive_owner")
+        user = db.scalars(select(User).where(User.username == "consecutive_owner")).one()
+        rows = [
+            {"title": f"Todo {index}", "organization_id": user.organization_id, "created_by": user.id}
+            for index in range(2)
+        ]
+        
+        # SQLite reports the last rowid of a multi-row INSERT, not the first,
+        # so the id range read back misses part of the batch.
+        with pytest.raises(HTTPException) as exc_info:
+            _insert_consecutive(db, Todo, rows, user)
+        
+        assert exc_info.value.status_code == 500
+        assert db.scalar(select(func.count()).select_from(Todo).where(Todo.created_by == user.id)) == 0
@@ -0,0 +1,144 @@
+import asyncio
+import gzip
+import zlib
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+
+def _run(app, chunks, content_type="application/json", status=200, accept_encoding="gzip"):
+    async def endpoint(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type.encode())],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+    
+    sent = []
+    
+    async def send(message):
+        sent.append(message)
+    
+    async def receive():
+        return {"type": "http.request", "body": b""}
+    
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(app(endpoint)(scope, receive, send))
+    headers = {key.decode(): value.decode() for key, value in sent[0]["headers"]}
+    return headers, [message["body"] for message in sent[1:]]
+
+
+class TestNegotiateEncoding:
+    def test_honours_quality_values(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+        
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip;q=0, identity") is None
+        assert negotiate_encoding("*;q=0.5") == "gzip"
+        assert negotiate_encoding("br") is None
+        assert negotiate_encoding("") is None
+    
+    def test_prefers_brotli_when_available(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", object())
+        
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+
+class TestCompressionMiddleware:
+    def middleware(self, **options):
+        return lambda app: CompressionMiddleware(app, minimum_size=100, **options)
+    
+    def test_streamed_chunks_are_flushed_as_they_arrive(self):
+        chunks = [b'{"id":1}\n' * 50, b'{"id":2}\n' * 50]
+        headers, bodies = _run(self.middleware(), chunks, content_type="application/x-ndjson")
+        
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decompressor.decompress(bodies[0]) == chunks[0]
+        assert decompressor.decompress(bodies[1]) == chunks[1]
+    
+    def test_event_streams_and_not_modified_pass_through(self):
+        body = b"data: x\n\n" * 50
+        
+        headers, bodies = _run(self.middleware(), [body], content_type="text/event-stream")
+        assert "content-encoding" not in headers
+        assert bodies == [body]
+        
+        headers, bodies = _run(self.middleware(), [b""], status=304)
+        assert "content-encoding" not in headers
+    
+    def test_respects_gzip_level(self):
+        body = b"".join(b'{"id":%d,"title":"Note %d"}' % (index, index) for index in range(500))
+        
+        _, fast = _run(self.middleware(gzip_level=1), [body])
+        _, best = _run(self.middleware(gzip_level=9), [body])
+        
+        assert gzip.decompress(fast[0]) == gzip.decompress(best[0]) == body
+        # The gzip header's XFL byte records fastest (4) vs. maximum (2) compression.
+        assert (fast[0][8], best[0][8]) == (4, 2)
+
+
+class TestCompressedEndpoints:
+    def test_large_list_is_gzipped(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(20):
+            client.post("/api/v1/notes/", json={"title": f"Note {index}", "content": "content " * 20}, headers=headers)
+        
+        response = client.get("/api/v1/notes/", headers={**headers, "Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert len(response.json()) == 20
+    
+    def test_small_bodies_and_not_modified_are_not_compressed(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "T", "content": "c"}, headers=headers).json()["id"]
+        
+        response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        
+        etag = response.headers["etag"]
+        response = client.get(
+            f"/api/v1/notes/{note_id}",
+            headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == etag == '"1-gzip"'
+    
+    def test_compressed_detail_has_coding_specific_etag_accepted_by_preconditions(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "T", "content": "c" * 2000}, headers=headers).json()["id"]
+        
+        response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        etag = response.headers["etag"]
+        assert etag == '"1-gzip"'
+        
+        response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+        response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "Accept-Encoding": "identity"})
+        assert response.headers["etag"] == '"1"'
+        
+        response = client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers={**headers, "If-Match": 'W/"1"'})
+        assert response.status_code == 412
+        response = client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 200
+        response = client.put(f"/api/v1/notes/{note_id}", json={"content": "again"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+    
+    def test_export_stream_is_compressed(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(30):
+            client.post("/api/v1/todos/", json={"title": f"Todo {index}"}, headers=headers)
+        
+        response = client.get("/api/v1/todos/export", params={"format": "json"}, headers={**headers, "Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert len(response.json()) == 30
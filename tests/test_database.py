@@ -0,0 +1,42 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.database import InstrumentedQueuePool
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestPoolMetrics:
+    def test_checkout_timeout_is_recorded(self):
+        engine = create_engine(
+            "sqlite:///./test.db",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        checkouts = _sample("db_pool_checkouts_total", pool="sync")
+        timeouts = _sample("db_pool_checkout_timeouts_total", pool="sync")
+        waited = _sample("db_pool_checkout_wait_seconds_sum", pool="sync")
+        
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        engine.dispose()
+        
+        assert _sample("db_pool_checkouts_total", pool="sync") == checkouts + 1
+        assert _sample("db_pool_checkout_timeouts_total", pool="sync") == timeouts + 1
+        assert _sample("db_pool_checkout_wait_seconds_sum", pool="sync") - waited >= 0.05
+    
+    def test_pool_state_is_collected_for_metrics(self, client):
+        client.get("/")
+        
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert 'db_pool_size{pool="sync"}' in response.text
+        assert 'db_pool_checked_in{pool="sync"}' in response.text
+        assert client.get("/metrics/db-pool").status_code == 404
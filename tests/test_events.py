@@ -0,0 +1,131 @@
+import asyncio
+import json
+from app import database
+from app.api.events import _event_stream
+from app.core.events import InMemoryBroker, get_broker
+from app.core.security import clear_token_version_cache
+from app.main import app
+from tests.conftest import engine
+
+
+def _read_event(lines) -> tuple:
+    event = None
+    for line in lines:
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: ") and event is not None:
+            return event, json.loads(line[len("data: "):])
+
+
+class TestEventBroker:
+    def test_fans_out_within_organization_only(self):
+        async def scenario():
+            broker = InMemoryBroker(queue_size=10)
+            own = broker.subscribe(1)
+            other = broker.subscribe(2)
+            
+            broker.publish(1, "note.created", {"id": 7})
+            await asyncio.sleep(0)
+            
+            assert await own.get(1) == 'event: note.created\ndata: {"id":7}\n\n'
+            assert other.queue.empty()
+        
+        asyncio.run(scenario())
+    
+    def test_drops_slow_consumers(self):
+        async def scenario():
+            broker = InMemoryBroker(queue_size=2)
+            slow = broker.subscribe(1)
+            
+            for id in range(3):
+                broker.publish(1, "todo.updated", {"id": id})
+            await asyncio.sleep(0)
+            
+            assert slow.overflowed
+            assert await slow.get(1) is None
+        
+        asyncio.run(scenario())
+
+
+class TestEventStream:
+    def test_handlers_publish_to_callers_organization(self, client, signup_and_login):
+        headers = signup_and_login()
+        other_headers = signup_and_login()
+        organization_id = client.get("/api/v1/auth/me", headers=headers).json()["organization_id"]
+        
+        async def scenario():
+            subscription = get_broker().subscribe(organization_id)
+            try:
+                await asyncio.to_thread(
+                    client.post, "/api/v1/notes/", json={"title": "Elsewhere", "content": "c"}, headers=other_headers
+                )
+                response = await asyncio.to_thread(
+                    client.post, "/api/v1/notes/", json={"title": "Shared", "content": "c"}, headers=headers
+                )
+                await asyncio.to_thread(client.delete, f"/api/v1/notes/{response.json()['id']}", headers=headers)
+                
+                events = [_read_event((await subscription.get(5)).splitlines()) for _ in range(2)]
+                return events, response.json()
+            finally:
+                get_broker().unsubscribe(subscription)
+        
+        (created, deleted), note = asyncio.run(scenario())
+        
+        assert created[0] == "note.created"
+        assert (created[1]["id"], created[1]["title"]) == (note["id"], "Shared")
+        assert deleted == ("note.deleted", {"id": note["id"]})
+    
+    def test_stream_ends_after_overflow_and_unsubscribes(self):
+        async def scenario():
+            broker = get_broker()
+            subscription = broker.subscribe(-1)
+            stream = _event_stream(subscription)
+            
+            assert (await stream.__anext__()).startswith("retry:")
+            subscription.offer("event: todo.created\ndata: {}\n\n")
+            assert (await stream.__anext__()).startswith("event: todo.created")
+            
+            for _ in range(subscription.queue.maxsize + 1):
+                subscription.offer("event: todo.updated\ndata: {}\n\n")
+            assert await stream.__anext__() == "event: overflow\ndata: {}\n\n"
+            assert [message async for message in stream] == []
+            
+            return broker.subscriber_count()
+        
+        assert asyncio.run(scenario()) == 0
+    
+    def test_open_stream_holds_no_pooled_connection(self, client, signup_and_login):
+        headers = signup_and_login()
+        clear_token_version_cache()
+        scope = {
+            "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/api/v1/events", "raw_path": b"/api/v1/events", "root_path": "",
+            "query_string": b"", "server": ("testserver", 80), "client": ("testclient", 50000),
+            "headers": [(b"host", b"testserver"), (b"authorization", headers["Authorization"].encode())],
+        }
+        
+        async def scenario():
+            started = asyncio.Event()
+            requested = []
+            
+            async def receive():
+                if not requested:
+                    requested.append(True)
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                await asyncio.Event().wait()
+            
+            async def send(message):
+                if message["type"] == "http.response.body":
+                    started.set()
+            
+            stream = asyncio.create_task(app(scope, receive, send))
+            try:
+                await asyncio.wait_for(started.wait(), 5)
+                return engine.pool.checkedout(), database.engine.pool.checkedout()
+            finally:
+                stream.cancel()
+        
+        assert asyncio.run(scenario()) == (0, 0)
+    
+    def test_requires_authentication(self, client):
+        assert client.get("/api/v1/events").status_code in (401, 403)
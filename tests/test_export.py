@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import resource
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from app.core.security import create_access_token
+from app.database import get_db
+from app.main import app
+from app.models.base import Base
+from tests.conftest import override_get_db, unique_name
+
+EXPORT_MEMORY_ROWS = int(os.environ.get("EXPORT_MEMORY_ROWS", 1_000_000))
+
+
+class TestExport:
+    def test_export_streams_ndjson_for_own_organization(self, client, signup_and_login):
+        headers = signup_and_login()
+        other_headers = signup_and_login()
+        for index in range(3):
+            client.post("/api/v1/notes/", json={"title": f"Note {index}", "content": "c"}, headers=headers)
+        client.post("/api/v1/notes/", json={"title": "Foreign", "content": "c"}, headers=other_headers)
+        
+        response = client.get("/api/v1/notes/export", headers=headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == ["Note 0", "Note 1", "Note 2"]
+        assert rows[0]["created_by_username"]
+    
+    def test_export_as_json_array(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers)
+        
+        response = client.get("/api/v1/todos/export", params={"format": "json"}, headers=headers)
+        
+        assert response.status_code == 200
+        assert [todo["title"] for todo in response.json()] == ["Todo"]
+        assert client.get("/api/v1/notes/export", params={"format": "json"}, headers=headers).json() == []
+    
+    def test_export_requires_admin(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        signup_and_login(organization_name=organization_name)
+        member_headers = signup_and_login(organization_name=organization_name)
+        
+        assert client.get("/api/v1/notes/export", headers=member_headers).status_code == 403
+    
+    def test_export_memory_stays_flat(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(text("DROP TRIGGER notes_fts_ai"))
+            connection.execute(text(
+                "INSERT INTO organizations (id, name, search_name, created_at, updated_at) "
+                "VALUES (1, 'org', 'org', '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+            ))
+            connection.execute(text(
+                "INSERT INTO users (id, username, password_hash, role, organization_id, created_at, updated_at) "
+                "VALUES (1, 'user', 'x', 'ADMIN', 1, '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+            ))
+            connection.execute(text(
+                "INSERT INTO notes (title, content, organization_id, created_by, created_at, updated_at, version) "
+                "WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < :rows) "
+                "SELECT 'Note ' || i, 'Some note content for export', 1, 1, stamp, stamp, 1 FROM ("
+                "SELECT i, strftime('%Y-%m-%d %H:%M:%S', '2024-01-01', '+' || i || ' seconds') || '.000000' AS stamp FROM seq)"
+            ), {"rows": EXPORT_MEMORY_ROWS})
+        
+        SessionLocal = sessionmaker(bind=engine)
+        
+        def export_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+        
+        token = create_access_token({"sub": "user", "user_id": 1, "organization_id": 1, "role": "ADMIN"})
+        scope = {
+            "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/api/v1/notes/export", "raw_path": b"/api/v1/notes/export", "root_path": "",
+            "query_string": b"", "server": ("testserver", 80), "client": ("testclient", 50000),
+            "headers": [(b"host", b"testserver"), (b"authorization", f"Bearer {token}".encode())],
+        }
+        received = {"status": None, "lines": 0}
+        requested = []
+        
+        async def receive():
+            if not requested:
+                requested.append(True)
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # StreamingResponse waits for a disconnect; it cancels this once the body is sent.
+            await asyncio.Event().wait()
+        
+        async def send(message):
+            # Count lines as chunks arrive instead of buffering the body like TestClient does.
+            if message["type"] == "http.response.start":
+                received["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                received["lines"] += message.get("body", b"").count(b"\n")
+        
+        app.dependency_overrides[get_db] = export_db
+        peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        try:
+            asyncio.run(app(scope, receive, send))
+        finally:
+            app.dependency_overrides[get_db] = override_get_db
+        peak_growth_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak_before
+        engine.dispose()
+        
+        assert received["status"] == 200
+        assert received["lines"] == EXPORT_MEMORY_ROWS
+        assert peak_growth_kb < 64 * 1024
@@ -0,0 +1,96 @@
+import threading
+import time
+from app.api import health
+from app.core.config import settings
+
+
+class TestHealth:
+    def setup_method(self):
+        health.clear_readiness_cache()
+    
+    def teardown_method(self):
+        health.clear_readiness_cache()
+    
+    def test_liveness_has_no_dependencies(self, client):
+        response = client.get("/health/live")
+        
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+    
+    def test_readiness_reports_per_check_latency(self, client):
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["cached"] is False
+        assert body["checks"]["database"]["status"] == "ok"
+        assert body["checks"]["database"]["latency_ms"] >= 0
+        assert body["checks"]["pool"]["saturation"] < settings.health_pool_saturation_threshold
+    
+    def test_probes_within_ttl_reuse_the_cached_result(self, client, monkeypatch):
+        first = client.get("/health/ready").json()
+        monkeypatch.setattr(health, "_database_check", lambda: {"status": "error", "latency_ms": 0.0})
+        
+        second = client.get("/health/ready")
+        
+        assert second.status_code == 200
+        assert second.json()["cached"] is True
+        assert second.json()["checked_at"] == first["checked_at"]
+    
+    def test_database_failure_makes_pod_unready(self, client, monkeypatch):
+        monkeypatch.setattr(health, "_database_check", lambda: {"status": "error", "latency_ms": 1.0, "error": "OperationalError"})
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["status"] == "unready"
+        assert response.json()["checks"]["database"]["error"] == "OperationalError"
+    
+    def test_hung_database_times_out_at_the_latency_threshold(self, client, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(settings, "health_db_latency_threshold_ms", 50.0)
+        monkeypatch.setattr(health, "_ping", lambda: release.wait(5))
+        try:
+            started = time.perf_counter()
+            response = client.get("/health/ready")
+            elapsed = time.perf_counter() - started
+            
+            health.clear_readiness_cache()
+            again = client.get("/health/ready")
+        finally:
+            release.set()
+            health._pending_ping.result(timeout=5)
+        
+        assert response.status_code == 503
+        assert response.json()["checks"]["database"]["status"] == "timeout"
+        assert elapsed < 1
+        assert again.json()["checks"]["database"] == {"status": "timeout", "latency_ms": 0.0}
+    
+    def test_probes_do_not_wait_for_checks_in_progress(self, client):
+        first = client.get("/health/ready").json()
+        health._readiness_cache.delete("ready")
+        
+        with health._readiness_lock:
+            stale = client.get("/health/ready")
+            health.clear_readiness_cache()
+            unready = client.get("/health/ready")
+        
+        assert stale.status_code == 200
+        assert stale.json()["checked_at"] == first["checked_at"]
+        assert unready.status_code == 503
+        assert unready.json()["status"] == "unready"
+    
+    def test_saturated_pool_skips_the_ping(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "health_pool_saturation_threshold", 0.0)
+        monkeypatch.setattr(health, "_database_check", lambda: _unexpected_ping())
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["checks"]["pool"]["status"] == "saturated"
+        assert response.json()["checks"]["database"]["status"] == "skipped"
+
+
+def _unexpected_ping():
+    raise AssertionError("database should not be pinged while the pool is saturated")
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine, select, text
+from app.models.base import Base
+from app.api.organizations import _infix_search_query, _prefix_search_query
+from app.models.note import Note
+from app.models.todo import Todo
+
+
+@pytest.fixture
+def explain():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    
+    def _explain(statement) -> str:
+        compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+        with engine.connect() as connection:
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return "\n".join(row[-1] for row in rows)
+    
+    yield _explain
+    engine.dispose()
+
+
+class TestIndexes:
+    def test_org_listing_uses_created_at_index(self, explain):
+        plan = explain(
+            select(Note).where(Note.organization_id == 1).order_by(Note.created_at, Note.id)
+        )
+        assert "ix_notes_org_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_my_notes_uses_created_by_index(self, explain):
+        plan = explain(
+            select(Note).where(Note.organization_id == 1, Note.created_by == 2).order_by(Note.created_at)
+        )
+        assert "ix_notes_org_created_by_created_at" in plan
+    
+    def test_todo_completed_filter_uses_index(self, explain):
+        plan = explain(
+            select(Todo.id).where(Todo.organization_id == 1, Todo.completed.is_(False))
+        )
+        assert "ix_todos_org_completed" in plan
+    
+    def test_organization_prefix_search_uses_index(self, explain):
+        plan = explain(_prefix_search_query("acm", 10))
+        assert "ix_organizations_search_name" in plan
+        assert "SCAN organizations" not in plan
+    
+    def test_organization_infix_search_uses_trigram_index(self, explain):
+        plan = explain(_infix_search_query("acme", "cme", 10, []))
+        assert "SCAN organizations" not in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,122 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import event
+from app.core.security import clear_token_version_cache
+from app.core.list_cache import InMemoryListCache, get_list_cache, set_list_cache
+from tests.conftest import engine, unique_name
+
+
+class TestListCache:
+    def test_repeated_reads_hit_until_a_write(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "First", "content": "c"}, headers=headers).json()["id"]
+        
+        first = client.get("/api/v1/notes/", headers=headers)
+        second = client.get("/api/v1/notes/", headers=headers)
+        assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+        assert second.json() == first.json()
+        
+        client.put(f"/api/v1/notes/{note_id}", json={"title": "Renamed"}, headers=headers)
+        response = client.get("/api/v1/notes/", headers=headers)
+        assert response.headers["x-cache"] == "MISS"
+        assert [note["title"] for note in response.json()] == ["Renamed"]
+        
+        client.delete(f"/api/v1/notes/{note_id}", headers=headers)
+        assert client.get("/api/v1/notes/", headers=headers).json() == []
+    
+    def test_list_query_sees_a_write_that_lands_after_authentication(self, client, signup_and_login, monkeypatch):
+        headers = signup_and_login()
+        client.post("/api/v1/notes/", json={"title": "Before", "content": "c"}, headers=headers)
+        cache = get_list_cache()
+        read_generation = cache.generation
+        events = []
+        
+        def generation_after_a_write(namespace):
+            # Another request writes once this one has authenticated.
+            if "generation" not in events:
+                client.post("/api/v1/notes/", json={"title": "During", "content": "c"}, headers=headers)
+            events.append("generation")
+            return read_generation(namespace)
+        
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            events.append(statement)
+        
+        def record_commit(conn):
+            events.append("COMMIT")
+        
+        clear_token_version_cache()
+        monkeypatch.setattr(cache, "generation", generation_after_a_write)
+        event.listen(engine, "before_cursor_execute", record_statement)
+        event.listen(engine, "commit", record_commit)
+        try:
+            response = client.get("/api/v1/notes/", headers=headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+            event.remove(engine, "commit", record_commit)
+        
+        assert sorted(note["title"] for note in response.json()) == ["Before", "During"]
+        after_generation = events[events.index("generation") + 1:]
+        list_query = next(index for index, statement in enumerate(after_generation) if "FROM notes" in statement)
+        assert "COMMIT" in after_generation[:list_query]
+    
+    def test_keys_cover_filters_and_pages(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        admin_headers = signup_and_login(organization_name=organization_name)
+        member_headers = signup_and_login(organization_name=organization_name)
+        client.post("/api/v1/todos/", json={"title": "Admin"}, headers=admin_headers)
+        client.post("/api/v1/todos/", json={"title": "Member"}, headers=member_headers)
+        
+        assert len(client.get("/api/v1/todos/", headers=admin_headers).json()) == 2
+        assert client.get("/api/v1/todos/", headers=member_headers).headers["x-cache"] == "HIT"
+        assert [todo["title"] for todo in client.get("/api/v1/todos/my-todos", headers=admin_headers).json()] == ["Admin"]
+        assert [todo["title"] for todo in client.get("/api/v1/todos/my-todos", headers=member_headers).json()] == ["Member"]
+        
+        page = client.get("/api/v1/todos/", params={"limit": 1}, headers=admin_headers).json()
+        assert len(page["items"]) == 1
+        assert list(client.get("/api/v1/todos/", params={"fields": "title"}, headers=admin_headers).json()[0]) == ["title"]
+    
+    def test_organizations_are_isolated(self, client, signup_and_login):
+        headers = signup_and_login()
+        other_headers = signup_and_login()
+        client.get("/api/v1/notes/", headers=other_headers)
+        
+        client.post("/api/v1/notes/", json={"title": "Mine", "content": "c"}, headers=headers)
+        
+        response = client.get("/api/v1/notes/", headers=other_headers)
+        assert response.headers["x-cache"] == "HIT"
+        assert response.json() == []
+    
+    def test_bulk_and_import_writes_invalidate(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.get("/api/v1/todos/", headers=headers)
+        
+        client.post("/api/v1/todos/bulk", json=[{"title": "Bulk"}], headers=headers)
+        assert len(client.get("/api/v1/todos/", headers=headers).json()) == 1
+        
+        client.post(
+            "/api/v1/todos/import",
+            files={"file": ("todos.ndjson", b'{"title": "Imported"}\n', "application/x-ndjson")},
+            headers=headers
+        )
+        assert len(client.get("/api/v1/todos/", headers=headers).json()) == 2
+    
+    def test_backend_is_pluggable_and_reports_stats(self, client, signup_and_login):
+        previous = get_list_cache()
+        set_list_cache(InMemoryListCache(maxsize=16))
+        try:
+            headers = signup_and_login()
+            hits = REGISTRY.get_sample_value("list_cache_lookups_total", {"result": "hit"}) or 0.0
+            client.get("/api/v1/notes/", headers=headers)
+            client.get("/api/v1/notes/", headers=headers)
+            client.post("/api/v1/notes/", json={"title": "T", "content": "c"}, headers=headers)
+            
+            scrape = client.get("/metrics").text
+            stats = {
+                name: REGISTRY.get_sample_value(name)
+                for name in ("list_cache_size", "list_cache_maxsize", "list_cache_invalidations_total")
+            }
+        finally:
+            set_list_cache(previous)
+        
+        assert REGISTRY.get_sample_value("list_cache_lookups_total", {"result": "hit"}) == hits + 1
+        assert stats == {"list_cache_size": 1, "list_cache_maxsize": 16, "list_cache_invalidations_total": 1}
+        assert "list_cache_invalidations_total 1.0" in scrape
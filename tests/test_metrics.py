@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from app.database import InstrumentedQueuePool
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestPrometheusMetrics:
+    def test_exposes_request_and_list_metrics(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.post("/api/v1/notes/", json={"title": "T", "content": "c"}, headers=headers)
+        listed = _sample("list_response_rows_count", resource="notes")
+        
+        client.get("/api/v1/notes/", headers=headers)
+        response = client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_requests_total{method="GET",route="/api/v1/notes/",status="200"}' in response.text
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/api/v1/notes/",status="200"}' in response.text
+        assert _sample("list_response_rows_count", resource="notes") == listed + 1
+    
+    def test_counts_auth_work(self, client, signup_and_login):
+        verified = _sample("password_verify_seconds_count")
+        invalid = _sample("jwt_decode_failures_total", reason="invalid")
+        
+        signup_and_login()
+        client.get("/api/v1/notes/", headers={"Authorization": "Bearer not-a-token"})
+        
+        assert _sample("password_verify_seconds_count") == verified + 1
+        assert _sample("jwt_decode_failures_total", reason="invalid") == invalid + 1
+    
+    def test_tracks_pool_checkouts(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, pool_size=2)
+        checkouts = _sample("db_pool_checkouts_total", pool="sync")
+        
+        with engine.connect():
+            assert _sample("db_pool_connections_checked_out", pool="sync") == 1
+        
+        assert _sample("db_pool_connections_checked_out", pool="sync") == 0
+        assert _sample("db_pool_checkouts_total", pool="sync") == checkouts + 1
+        engine.dispose()
+    
+    def test_aggregates_across_worker_processes(self, tmp_path):
+        environment = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        worker = "from app.core import metrics; metrics.observe_request('GET', '/api/v1/notes/', 200, 0.01, 2, 0.001)"
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", worker], env=environment, check=True)
+        
+        scrape = subprocess.run(
+            [sys.executable, "-c", "from app.core import list_cache, metrics; print(metrics.render_metrics()[0].decode())"],
+            env=environment, check=True, capture_output=True, text=True
+        ).stdout
+        
+        assert 'http_requests_total{method="GET",route="/api/v1/notes/",status="200"} 2.0' in scrape
+        assert 'http_request_db_statements_total{method="GET",route="/api/v1/notes/"} 4.0' in scrape
+        assert 'list_cache_maxsize{pid="' in scrape
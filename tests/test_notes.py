@@ -0,0 +1,205 @@
+from app.core import serialization
+from app.core.list_cache import InMemoryListCache, get_list_cache, set_list_cache
+from tests.conftest import count_queries, unique_name
+
+
+class TestNotes:
+    def test_list_notes_loads_creators_in_one_query(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        headers = [signup_and_login(organization_name=organization_name) for _ in range(3)]
+        for index, member_headers in enumerate(headers):
+            client.post(
+                "/api/v1/notes/",
+                json={"title": f"Note {index}", "content": "content"},
+                headers=member_headers
+            )
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/notes/", headers=headers[0])
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert len({note["created_by_username"] for note in data}) == 3
+        assert counter.count == 1
+    
+    def test_my_notes_loads_creator_in_one_query(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(3):
+            client.post(
+                "/api/v1/notes/",
+                json={"title": f"Note {index}", "content": "content"},
+                headers=headers
+            )
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/notes/my-notes", headers=headers)
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert counter.count == 1
+    
+    def test_get_note_loads_creator_in_one_query(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post(
+            "/api/v1/notes/",
+            json={"title": "Note", "content": "content"},
+            headers=headers
+        ).json()["id"]
+        
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/notes/{note_id}", headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json()["created_by_username"]
+        assert counter.count == 1
+    
+    def test_list_notes_keyset_pagination(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(5):
+            client.post(
+                "/api/v1/notes/",
+                json={"title": f"Item {index}", "content": "content"},
+                headers=headers
+            )
+        
+        titles = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/v1/notes/", params=params, headers=headers)
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["items"]) <= 2
+            titles.extend(item["title"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        
+        assert titles == [f"Item {index}" for index in range(5)]
+    
+    def test_list_notes_rejects_invalid_cursor(self, client, signup_and_login):
+        headers = signup_and_login()
+        response = client.get("/api/v1/notes/", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert response.status_code == 400
+    
+    def test_create_note_does_not_read_back(self, client, signup_and_login):
+        headers = signup_and_login()
+        
+        with count_queries() as counter:
+            response = client.post("/api/v1/notes/", json={"title": "Note", "content": "content"}, headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json()["id"]
+        # User lookup, organization lock and change-log row, then the write itself.
+        assert counter.count == 4
+        assert counter.statements[-1].startswith("INSERT")
+    
+    def test_update_note_does_not_read_back(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "Note", "content": "content"}, headers=headers).json()["id"]
+        
+        with count_queries() as counter:
+            response = client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers=headers)
+        
+        assert response.status_code == 200
+        # User lookup, organization lock and change-log row, then the write itself.
+        assert counter.count == 4
+        assert counter.statements[-1].startswith("UPDATE")
+    
+    def test_get_note_revalidates_with_etag(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "Note", "content": "content"}, headers=headers).json()["id"]
+        etag = client.get(f"/api/v1/notes/{note_id}", headers=headers).headers["etag"]
+        
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert counter.count == 1
+        assert "JOIN" not in counter.statements[0]
+        
+        client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers=headers)
+        response = client.get(f"/api/v1/notes/{note_id}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    
+    def test_if_match_rejects_stale_writes(self, client, signup_and_login):
+        headers = signup_and_login()
+        created = client.post("/api/v1/notes/", json={"title": "Note", "content": "content"}, headers=headers)
+        note_id = created.json()["id"]
+        etag = created.headers["etag"]
+        
+        response = client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+        
+        response = client.put(f"/api/v1/notes/{note_id}", json={"content": "changed"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+        response = client.delete(f"/api/v1/notes/{note_id}", headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+        response = client.put(f"/api/v1/notes/999999", json={"content": "changed"}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 404
+        
+        fresh = client.get(f"/api/v1/notes/{note_id}", headers=headers).headers["etag"]
+        assert client.delete(f"/api/v1/notes/{note_id}", headers={**headers, "If-Match": fresh}).status_code == 200
+    
+    def test_list_matches_validated_detail_and_keeps_schema(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "Ünïcode", "content": "c"}, headers=headers).json()["id"]
+        
+        listed = client.get("/api/v1/notes/", headers=headers).json()
+        detail = client.get(f"/api/v1/notes/{note_id}", headers=headers).json()
+        assert listed == [detail]
+        
+        schema = client.get("/api/v1/openapi.json").json()
+        response_schema = schema["paths"]["/api/v1/notes/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert "#/components/schemas/NoteWithUser" in str(response_schema)
+    
+    def test_list_serializes_without_orjson(self, client, signup_and_login, monkeypatch):
+        headers = signup_and_login()
+        client.post("/api/v1/notes/", json={"title": "Ünïcode", "content": "c"}, headers=headers)
+        expected = client.get("/api/v1/notes/", headers=headers).json()
+        
+        monkeypatch.setattr(serialization, "orjson", None)
+        previous = get_list_cache()
+        set_list_cache(InMemoryListCache(maxsize=16))
+        try:
+            response = client.get("/api/v1/notes/", headers=headers)
+        finally:
+            set_list_cache(previous)
+        
+        assert response.headers["x-cache"] == "MISS"
+        assert response.json() == expected
+    
+    def test_fields_projects_columns_and_previews_content(self, client, signup_and_login):
+        headers = signup_and_login()
+        note = client.post("/api/v1/notes/", json={"title": "Long", "content": "x" * 1000}, headers=headers).json()
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/notes/", params={"fields": "id,title,content_preview"}, headers=headers)
+        
+        assert response.json() == [{"id": note["id"], "title": "Long", "content_preview": "x" * 200}]
+        assert counter.statements[0].count("notes.content") == 1
+        assert "substr(notes.content" in counter.statements[0]
+        assert "JOIN users" not in counter.statements[0]
+        
+        page = client.get("/api/v1/notes/", params={"fields": "title", "limit": 1}, headers=headers).json()
+        assert page == {"items": [{"title": "Long"}], "next_cursor": None}
+        
+        detail = client.get(
+            f"/api/v1/notes/{note['id']}",
+            params={"fields": "title,created_by_username"},
+            headers={**headers, "Accept-Encoding": "identity"}
+        )
+        assert set(detail.json()) == {"title", "created_by_username"}
+        assert detail.headers["etag"] == '"1"'
+    
+    def test_fields_rejects_unknown_names(self, client, signup_and_login):
+        headers = signup_and_login()
+        response = client.get("/api/v1/notes/", params={"fields": "title,password_hash"}, headers=headers)
+        assert response.status_code == 400
+        assert "password_hash" in response.json()["detail"]
@@ -0,0 +1,142 @@
+from app.core.security import clear_token_cache, clear_token_version_cache
+from tests.conftest import count_queries, unique_name
+
+
+class TestOrganizations:
+    def test_reads_do_not_look_up_user(self, client, signup_and_login):
+        headers = signup_and_login()
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/organizations/me", headers=headers)
+        
+        assert response.status_code == 200
+        assert not any("FROM users" in statement for statement in counter.statements)
+    
+    def test_role_change_revokes_existing_tokens(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        admin_headers = signup_and_login(organization_name=organization_name)
+        member_username = unique_name("member")
+        member_headers = signup_and_login(organization_name=organization_name, username=member_username)
+        member = client.get("/api/v1/auth/me", headers=member_headers).json()
+        assert client.get("/api/v1/notes/", headers=member_headers).status_code == 200
+        
+        response = client.put(
+            f"/api/v1/organizations/{member['organization_id']}/users/{member['id']}",
+            params={"role": "ADMIN"},
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+        
+        assert client.get("/api/v1/notes/", headers=member_headers).status_code == 401
+        
+        login = client.post(
+            "/api/v1/auth/login",
+            json={"username": member_username, "password": "testpass"}
+        )
+        fresh_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        assert client.get("/api/v1/notes/", headers=fresh_headers).status_code == 200
+    
+    def test_revocation_reaches_other_workers(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        admin_headers = signup_and_login(organization_name=organization_name)
+        demoted_headers = signup_and_login(organization_name=organization_name)
+        removed_headers = signup_and_login(organization_name=organization_name)
+        organization_id = client.get("/api/v1/auth/me", headers=admin_headers).json()["organization_id"]
+        demoted = client.get("/api/v1/auth/me", headers=demoted_headers).json()
+        removed = client.get("/api/v1/auth/me", headers=removed_headers).json()
+        
+        client.put(f"/api/v1/organizations/{organization_id}/users/{demoted['id']}", params={"role": "ADMIN"}, headers=admin_headers)
+        client.delete(f"/api/v1/organizations/{organization_id}/users/{removed['id']}", headers=admin_headers)
+        # A fresh worker (or a restart) starts with empty in-process caches.
+        clear_token_cache()
+        clear_token_version_cache()
+        
+        assert client.get("/api/v1/notes/", headers=demoted_headers).status_code == 401
+        assert client.get("/api/v1/notes/", headers=removed_headers).status_code == 401
+        assert client.get("/api/v1/todos/", headers=removed_headers).status_code == 401
+        assert client.get("/api/v1/notes/", headers=admin_headers).status_code == 200
+    
+    def test_search_ranks_prefix_before_infix_matches(self, client):
+        base = unique_name("acme").lower()
+        for name in (f"Shop {base}", f"{base} Labs", base.upper()):
+            client.post(
+                "/api/v1/auth/signup",
+                json={"username": unique_name("user"), "password": "testpass", "organization_name": name}
+            )
+        
+        response = client.get("/api/v1/organizations/search", params={"q": base})
+        
+        assert response.status_code == 200
+        assert [org["name"] for org in response.json()] == [base.upper(), f"{base} Labs", f"Shop {base}"]
+        assert "max-age" in response.headers["Cache-Control"]
+    
+    def test_search_finds_infix_and_respects_limit(self, client):
+        base = unique_name("corp").lower()
+        for index in range(3):
+            client.post(
+                "/api/v1/auth/signup",
+                json={"username": unique_name("user"), "password": "testpass", "organization_name": f"{index} {base}"}
+            )
+        
+        infix = base[-8:]
+        assert len(client.get("/api/v1/organizations/search", params={"q": infix}).json()) == 3
+        assert len(client.get("/api/v1/organizations/search", params={"q": infix, "limit": 2}).json()) == 2
+    
+    def test_infix_search_ranks_shortest_candidate_first(self, client):
+        base = unique_name("firm").lower()
+        for name in [f"{index} long name {base}" for index in range(3)] + [f"x {base}"]:
+            client.post(
+                "/api/v1/auth/signup",
+                json={"username": unique_name("user"), "password": "testpass", "organization_name": name}
+            )
+        
+        response = client.get("/api/v1/organizations/search", params={"q": base[-8:], "limit": 1})
+        
+        assert [org["name"] for org in response.json()] == [f"x {base}"]
+    
+    def test_public_listing_revalidates_without_queries(self, client, signup_and_login):
+        signup_and_login()
+        first = client.get("/api/v1/organizations/public")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/organizations/public", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert counter.count == 0
+        
+        response = client.get(
+            "/api/v1/organizations/public",
+            headers={"If-Modified-Since": first.headers["last-modified"]}
+        )
+        assert response.status_code == 304
+    
+    def test_public_listing_invalidated_by_new_organization(self, client, signup_and_login):
+        signup_and_login()
+        etag = client.get("/api/v1/organizations/public").headers["etag"]
+        
+        organization_name = unique_name("org")
+        signup_and_login(organization_name=organization_name)
+        response = client.get("/api/v1/organizations/public", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert organization_name in [org["name"] for org in response.json()]
+    
+    def test_public_listing_paginates(self, client, signup_and_login):
+        for _ in range(3):
+            signup_and_login()
+        
+        response = client.get("/api/v1/organizations/public", params={"limit": 2})
+        body = response.json()
+        assert len(body["items"]) == 2
+        assert body["next_cursor"]
+        
+        response = client.get(
+            "/api/v1/organizations/public",
+            params={"limit": 2, "cursor": body["next_cursor"]}
+        )
+        assert response.status_code == 200
+        assert body["items"][-1]["id"] not in [org["id"] for org in response.json()["items"]]
@@ -0,0 +1,57 @@
+from tests.conftest import unique_name
+
+
+class TestNoteSearch:
+    def test_search_ranks_matches_within_organization(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        headers = signup_and_login(organization_name=organization_name)
+        other_headers = signup_and_login()
+        
+        client.post("/api/v1/notes/", json={"title": "Quarterly planning", "content": "budget review"}, headers=headers)
+        client.post("/api/v1/notes/", json={"title": "Groceries", "content": "milk, eggs"}, headers=headers)
+        client.post(
+            "/api/v1/notes/",
+            json={"title": "Planning planning", "content": "planning offsite planning"},
+            headers=headers
+        )
+        client.post("/api/v1/notes/", json={"title": "Planning", "content": "other org"}, headers=other_headers)
+        
+        response = client.get("/api/v1/notes/search", params={"q": "plan"}, headers=headers)
+        
+        assert response.status_code == 200
+        titles = [note["title"] for note in response.json()]
+        assert titles == ["Planning planning", "Quarterly planning"]
+    
+    def test_index_follows_updates_and_deletes(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post(
+            "/api/v1/notes/",
+            json={"title": "Draft", "content": "zebra"},
+            headers=headers
+        ).json()["id"]
+        
+        client.put(f"/api/v1/notes/{note_id}", json={"content": "giraffe"}, headers=headers)
+        assert client.get("/api/v1/notes/search", params={"q": "zebra"}, headers=headers).json() == []
+        assert len(client.get("/api/v1/notes/search", params={"q": "giraffe"}, headers=headers).json()) == 1
+        
+        client.delete(f"/api/v1/notes/{note_id}", headers=headers)
+        assert client.get("/api/v1/notes/search", params={"q": "giraffe"}, headers=headers).json() == []
+    
+    def test_search_paginates_and_ignores_query_syntax(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.post(
+            "/api/v1/notes/bulk",
+            json=[{"title": f"Report {index}", "content": "weekly"} for index in range(5)],
+            headers=headers
+        )
+        
+        first = client.get("/api/v1/notes/search", params={"q": '"weekly*', "limit": 3}, headers=headers).json()
+        second = client.get(
+            "/api/v1/notes/search",
+            params={"q": '"weekly*', "limit": 3, "offset": 3},
+            headers=headers
+        ).json()
+        
+        assert len(first) == 3
+        assert len(second) == 2
+        assert not {note["id"] for note in first} & {note["id"] for note in second}
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import timedelta
+import pytest
+from app.api import auth
+from app.core import cache, security
+from app.core.security import create_access_token, verify_token, token_cache_stats, clear_token_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+class TestTokenCache:
+    def test_repeated_verification_hits_cache(self, monkeypatch):
+        token = create_access_token({"user_id": 1})
+        assert verify_token(token)["user_id"] == 1
+        
+        def _fail_decode(*args, **kwargs):
+            raise AssertionError("token was decoded again")
+        
+        monkeypatch.setattr(security.jwt, "decode", _fail_decode)
+        assert verify_token(token)["user_id"] == 1
+        
+        stats = token_cache_stats()
+        assert stats["hits"] >= 1
+        assert stats["size"] == 1
+    
+    def test_expired_token_is_not_served_from_cache(self, monkeypatch):
+        token = create_access_token({"user_id": 1}, expires_delta=timedelta(minutes=5))
+        assert verify_token(token) is not None
+        
+        now = time.time()
+        monkeypatch.setattr(cache.time, "time", lambda: now + 600)
+        
+        def _expired_decode(*args, **kwargs):
+            raise security.JWTError("Signature has expired.")
+        
+        monkeypatch.setattr(security.jwt, "decode", _expired_decode)
+        assert verify_token(token) is None
+    
+    def test_invalid_token_is_not_cached(self):
+        assert verify_token("not-a-token") is None
+        assert token_cache_stats()["size"] == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        lru = cache.TTLCache(maxsize=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        
+        assert lru.get("b") is None
+        assert lru.get("a") == 1
+        assert lru.stats()["evictions"] == 1
+
+
+class TestPasswordPool:
+    def test_hash_and_verify_run_in_worker_pool(self):
+        async def _roundtrip():
+            hashed = await security.get_password_hash_async("secret")
+            return (
+                await security.verify_password_async("secret", hashed),
+                await security.verify_password_async("wrong", hashed)
+            )
+        
+        assert asyncio.run(_roundtrip()) == (True, False)
+    
+    def test_full_pool_times_out_with_busy_error(self, monkeypatch):
+        monkeypatch.setattr(security.settings, "password_hash_queue_timeout", 0.01)
+        
+        async def _saturate_and_verify():
+            slots = security._get_password_slots()
+            for _ in range(security.settings.password_hash_workers):
+                await slots.acquire()
+            await security.verify_password_async("secret", "hash")
+        
+        with pytest.raises(security.PasswordHashingBusy):
+            asyncio.run(_saturate_and_verify())
+    
+    def test_login_returns_503_when_pool_is_busy(self, client, monkeypatch):
+        client.post(
+            "/api/v1/auth/signup",
+            json={"username": "busy_user", "password": "testpass", "organization_name": "busy_org"}
+        )
+        
+        async def _busy(*args):
+            raise security.PasswordHashingBusy()
+        
+        monkeypatch.setattr(auth, "verify_password_async", _busy)
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": "busy_user", "password": "testpass"}
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,77 @@
+def _sync_all(client, headers, since=None, limit=50):
+    notes, todos, deleted = [], [], []
+    while True:
+        params = {"limit": limit}
+        if since is not None:
+            params["since"] = since
+        response = client.get("/api/v1/sync", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        notes += body["notes"]
+        todos += body["todos"]
+        deleted += body["deleted"]
+        since = body["next_token"]
+        if not body["has_more"]:
+            return notes, todos, deleted, since
+
+
+class TestSync:
+    def test_initial_sync_pages_through_everything(self, client, signup_and_login):
+        headers = signup_and_login()
+        other_headers = signup_and_login()
+        for index in range(5):
+            client.post("/api/v1/notes/", json={"title": f"Note {index}", "content": "c"}, headers=headers)
+        client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers)
+        client.post("/api/v1/notes/", json={"title": "Foreign", "content": "c"}, headers=other_headers)
+        
+        notes, todos, deleted, _ = _sync_all(client, headers, limit=2)
+        
+        assert [note["title"] for note in notes] == [f"Note {index}" for index in range(5)]
+        assert [todo["title"] for todo in todos] == ["Todo"]
+        assert deleted == []
+    
+    def test_delta_contains_only_changes_and_deletes(self, client, signup_and_login):
+        headers = signup_and_login()
+        kept = client.post("/api/v1/notes/", json={"title": "Kept", "content": "c"}, headers=headers).json()
+        edited = client.post("/api/v1/notes/", json={"title": "Edited", "content": "c"}, headers=headers).json()
+        removed = client.post("/api/v1/todos/", json={"title": "Removed"}, headers=headers).json()
+        bulk = client.post("/api/v1/todos/bulk", json=[{"title": "Bulk"}], headers=headers).json()
+        _, _, _, token = _sync_all(client, headers)
+        
+        client.put(f"/api/v1/notes/{edited['id']}", json={"title": "Edited again"}, headers=headers)
+        client.delete(f"/api/v1/todos/{removed['id']}", headers=headers)
+        client.request("DELETE", "/api/v1/todos/bulk", json={"ids": [bulk[0]["id"]]}, headers=headers)
+        
+        notes, todos, deleted, token = _sync_all(client, headers, since=token)
+        
+        assert [note["title"] for note in notes] == ["Edited again"]
+        assert kept["id"] not in [note["id"] for note in notes]
+        assert todos == []
+        assert sorted((item["resource_type"], item["id"]) for item in deleted) == sorted(
+            [("todos", removed["id"]), ("todos", bulk[0]["id"])]
+        )
+        
+        assert _sync_all(client, headers, since=token)[:3] == ([], [], [])
+    
+    def test_delta_follows_change_order_not_row_order(self, client, signup_and_login):
+        headers = signup_and_login()
+        first = client.post("/api/v1/todos/", json={"title": "First"}, headers=headers).json()
+        client.post("/api/v1/todos/", json={"title": "Second"}, headers=headers)
+        _, _, _, token = _sync_all(client, headers)
+        
+        client.patch("/api/v1/todos/bulk", json=[{"id": first["id"], "completed": True}], headers=headers)
+        client.post(
+            "/api/v1/todos/import",
+            files={"file": ("todos.csv", b"title,completed\nImported,false\n", "text/csv")},
+            headers=headers
+        )
+        
+        _, todos, _, _ = _sync_all(client, headers, since=token, limit=1)
+        
+        assert [(todo["title"], todo["completed"]) for todo in todos] == [("First", True), ("Imported", False)]
+    
+    def test_rejects_malformed_token(self, client, signup_and_login):
+        headers = signup_and_login()
+        response = client.get("/api/v1/sync", params={"since": "garbage"}, headers=headers)
+        assert response.status_code == 400
+
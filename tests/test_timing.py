@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import re
+from types import SimpleNamespace
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from app.core.timing import TimingMiddleware
+
+
+def _queries(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+def _run(middleware, statements):
+    engine = create_engine("sqlite://")
+    
+    async def endpoint(scope, receive, send):
+        with engine.connect() as connection:
+            for statement in statements:
+                connection.execute(text(statement))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+    
+    sent = []
+    
+    async def send(message):
+        sent.append(message)
+    
+    scope = {"type": "http", "method": "GET", "path": "/slow", "headers": [], "app": SimpleNamespace(routes=[])}
+    asyncio.run(middleware(endpoint)(scope, None, send))
+    return dict(sent[0]["headers"])
+
+
+class TestTimingMiddleware:
+    def test_server_timing_reports_database_work(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.post("/api/v1/notes/", json={"title": "First", "content": "c"}, headers=headers)
+        
+        response = client.get("/api/v1/notes/", headers=headers)
+        
+        assert re.fullmatch(r'app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries"', response.headers["server-timing"])
+        assert _queries(response) >= 1
+    
+    def test_list_query_count_does_not_grow_with_rows(self, client, signup_and_login):
+        headers = signup_and_login()
+        client.post("/api/v1/todos/", json={"title": "First"}, headers=headers)
+        baseline = _queries(client.get("/api/v1/todos/", headers=headers))
+        
+        for index in range(10):
+            client.post("/api/v1/todos/", json={"title": f"Todo {index}"}, headers=headers)
+        response = client.get("/api/v1/todos/", headers=headers)
+        
+        assert len(response.json()) == 11
+        assert _queries(response) == baseline
+    
+    def test_latency_is_recorded_per_route_template(self, client, signup_and_login):
+        headers = signup_and_login()
+        note_id = client.post("/api/v1/notes/", json={"title": "T", "content": "c"}, headers=headers).json()["id"]
+        route = "/api/v1/notes/{note_id}"
+        found = REGISTRY.get_sample_value("http_request_duration_seconds_count", {"method": "GET", "route": route, "status": "200"}) or 0.0
+        missing = REGISTRY.get_sample_value("http_requests_total", {"method": "GET", "route": route, "status": "404"}) or 0.0
+        
+        client.get(f"/api/v1/notes/{note_id}", headers=headers)
+        client.get(f"/api/v1/notes/{note_id + 1000}", headers=headers)
+        
+        assert REGISTRY.get_sample_value("http_request_duration_seconds_count", {"method": "GET", "route": route, "status": "200"}) == found + 1
+        assert REGISTRY.get_sample_value("http_requests_total", {"method": "GET", "route": route, "status": "404"}) == missing + 1
+        assert REGISTRY.get_sample_value("http_request_db_statements_total", {"method": "GET", "route": route}) >= 1
+        assert client.get("/metrics/requests").status_code == 404
+    
+    def test_slow_requests_are_logged_with_their_sql(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.timing"):
+            headers = _run(lambda app: TimingMiddleware(app, slow_request_ms=0), ["SELECT 1", "SELECT 2"])
+        
+        assert b"server-timing" in headers
+        assert "GET /slow (unmatched) -> 200" in caplog.text
+        assert "2 SQL statements" in caplog.text
+        assert "\n  SELECT 1\n  SELECT 2" in caplog.text
+    
+    def test_query_count_threshold(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.timing"):
+            _run(lambda app: TimingMiddleware(app, slow_request_ms=10000, query_warning_threshold=5), ["SELECT 1"])
+            assert caplog.text == ""
+            
+            _run(lambda app: TimingMiddleware(app, slow_request_ms=10000, query_warning_threshold=3), ["SELECT 1"] * 3)
+        assert "query count exceeds the warning threshold" in caplog.text
@@ -0,0 +1,146 @@
+from tests.conftest import count_queries, unique_name
+
+
+class TestTodos:
+    def test_list_todos_loads_creators_in_one_query(self, client, signup_and_login):
+        organization_name = unique_name("org")
+        headers = [signup_and_login(organization_name=organization_name) for _ in range(3)]
+        for index, member_headers in enumerate(headers):
+            client.post(
+                "/api/v1/todos/",
+                json={"title": f"Todo {index}"},
+                headers=member_headers
+            )
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/todos/", headers=headers[0])
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert len({todo["created_by_username"] for todo in data}) == 3
+        assert counter.count == 1
+    
+    def test_my_todos_loads_creator_in_one_query(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(3):
+            client.post(
+                "/api/v1/todos/",
+                json={"title": f"Todo {index}"},
+                headers=headers
+            )
+        
+        with count_queries() as counter:
+            response = client.get("/api/v1/todos/my-todos", headers=headers)
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert counter.count == 1
+    
+    def test_get_todo_loads_creator_in_one_query(self, client, signup_and_login):
+        headers = signup_and_login()
+        todo_id = client.post(
+            "/api/v1/todos/",
+            json={"title": "Todo"},
+            headers=headers
+        ).json()["id"]
+        
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/todos/{todo_id}", headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json()["created_by_username"]
+        assert counter.count == 1
+    
+    def test_list_todos_keyset_pagination(self, client, signup_and_login):
+        headers = signup_and_login()
+        for index in range(5):
+            client.post(
+                "/api/v1/todos/",
+                json={"title": f"Item {index}", "completed": False},
+                headers=headers
+            )
+        
+        titles = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/v1/todos/", params=params, headers=headers)
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["items"]) <= 2
+            titles.extend(item["title"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        
+        assert titles == [f"Item {index}" for index in range(5)]
+    
+    def test_list_todos_rejects_invalid_cursor(self, client, signup_and_login):
+        headers = signup_and_login()
+        response = client.get("/api/v1/todos/", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert response.status_code == 400
+    
+    def test_create_todo_does_not_read_back(self, client, signup_and_login):
+        headers = signup_and_login()
+        
+        with count_queries() as counter:
+            response = client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json()["id"]
+        # User lookup, organization lock and change-log row, then the write itself.
+        assert counter.count == 4
+        assert counter.statements[-1].startswith("INSERT")
+    
+    def test_update_todo_does_not_read_back(self, client, signup_and_login):
+        headers = signup_and_login()
+        todo_id = client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers).json()["id"]
+        
+        with count_queries() as counter:
+            response = client.put(f"/api/v1/todos/{todo_id}", json={"completed": True}, headers=headers)
+        
+        assert response.status_code == 200
+        # User lookup, organization lock and change-log row, then the write itself.
+        assert counter.count == 4
+        assert counter.statements[-1].startswith("UPDATE")
+    
+    def test_get_todo_revalidates_with_etag(self, client, signup_and_login):
+        headers = signup_and_login()
+        todo_id = client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers).json()["id"]
+        etag = client.get(f"/api/v1/todos/{todo_id}", headers=headers).headers["etag"]
+        
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/todos/{todo_id}", headers={**headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert counter.count == 1
+        assert "JOIN" not in counter.statements[0]
+        
+        client.put(f"/api/v1/todos/{todo_id}", json={"completed": True}, headers=headers)
+        response = client.get(f"/api/v1/todos/{todo_id}", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    
+    def test_if_match_rejects_stale_writes(self, client, signup_and_login):
+        headers = signup_and_login()
+        created = client.post("/api/v1/todos/", json={"title": "Todo"}, headers=headers)
+        todo_id = created.json()["id"]
+        etag = created.headers["etag"]
+        
+        response = client.put(f"/api/v1/todos/{todo_id}", json={"completed": True}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+        
+        response = client.put(f"/api/v1/todos/{todo_id}", json={"completed": True}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+        response = client.delete(f"/api/v1/todos/{todo_id}", headers={**headers, "If-Match": etag})
+        assert response.status_code == 412
+        response = client.put(f"/api/v1/todos/999999", json={"completed": True}, headers={**headers, "If-Match": etag})
+        assert response.status_code == 404
+        
+        fresh = client.get(f"/api/v1/todos/{todo_id}", headers=headers).headers["etag"]
+        assert client.delete(f"/api/v1/todos/{todo_id}", headers={**headers, "If-Match": fresh}).status_code == 200